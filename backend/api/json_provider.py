@@ -0,0 +1,40 @@
+"""
+orjson-backed JSON provider for the Flask app.
+Installed as app.json so every jsonify() call encodes with orjson and writes
+the UTF-8 bytes straight into the response.
+"""
+import decimal
+import orjson
+from flask.json.provider import JSONProvider
+
+# Sorted keys match Flask's default output. NumPy arrays and scalars (e.g.
+# model features) serialize without a .tolist() pass.
+ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj):
+    """Encode types orjson does not handle natively"""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider using orjson for encoding and decoding"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE),
+            mimetype='application/json'
+        )
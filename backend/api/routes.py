@@ -2,16 +2,20 @@
 Flask API Routes for ResumeSense
 Handles resume upload, analysis, and history retrieval.
 """
-from flask import Blueprint, request, jsonify, send_from_directory
-import os
-from werkzeug.utils import secure_filename
+from flask import Blueprint, Response, json, request, jsonify, make_response, stream_with_context
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.exceptions import RequestEntityTooLarge
 from backend.nlp.pdf_parser import PDFParser
 from backend.nlp.jd_matcher import JDMatcher
 from backend.nlp.ats_checker import ATSChecker
 from backend.nlp.power_verbs import PowerVerbSuggester
 from backend.nlp.resume_insights import ResumeInsights
-from backend.ml.resume_scorer import ResumeScorer
+from backend.ml.resume_scorer import get_scorer
 from backend.db.database import Database
+from backend.api.cache import LRUCache
+from backend.api.tasks import TaskQueue
+from backend.api.uploads import parse_analyze_form, UploadTooLargeError, InvalidUploadError, TEXT_FIELDS
 from backend.config import Config
 
 # Create blueprint
@@ -19,7 +23,24 @@ api_bp = Blueprint('api', __name__)
 
 # Initialize components
 db = Database()
-resume_scorer = ResumeScorer()
+resume_scorer = get_scorer()
+results_cache = LRUCache(maxsize=Config.RESULTS_CACHE_SIZE)
+pdf_text_cache = LRUCache(maxsize=Config.PDF_TEXT_CACHE_SIZE)
+analysis_tasks = TaskQueue(max_workers=Config.ANALYSIS_WORKERS)
+analyzer_pool = ThreadPoolExecutor(max_workers=Config.ANALYZER_THREADS, thread_name_prefix='analyzer')
+
+# Part of every results/PDF text cache key; bump whenever the parser or an
+# analyzer changes its output so cached payloads from older code are not served
+ANALYSIS_VERSION = 1
+
+
+@api_bp.before_request
+def reject_oversized_body():
+    """Reject requests whose declared body exceeds the upload limit before reading it"""
+    if request.content_length is not None and request.content_length > Config.MAX_UPLOAD_SIZE:
+        return jsonify({
+            'error': 'Uploaded file is too large.'
+        }), 413
 
 
 def allowed_file(filename):
@@ -28,6 +49,172 @@ def allowed_file(filename):
            filename.rsplit('.', 1)[1].lower() in Config.ALLOWED_EXTENSIONS
 
 
+def results_cache_key(resume_text, jd_text):
+    """
+    Content hash identifying an analysis of resume_text against jd_text by
+    this pipeline version and the loaded scoring model
+    """
+    prefix = f"{ANALYSIS_VERSION}\x1f{resume_scorer.model_version}\x1f"
+    return hashlib.sha256((prefix + resume_text + '\x1f' + jd_text).encode('utf-8')).hexdigest()
+
+
+def extract_pdf_text(pdf_bytes):
+    """
+    Extract text from PDF bytes, reusing earlier extractions of the same file.
+    Entries are keyed by the file hash only, so the PDF bytes are not retained.
+    
+    Args:
+        pdf_bytes: PDF file content
+        
+    Returns:
+        Extracted text (empty if extraction failed)
+    """
+    digest = hashlib.sha256(f'pdf:{ANALYSIS_VERSION}:'.encode('ascii'))
+    digest.update(pdf_bytes)
+    pdf_key = digest.hexdigest()
+    
+    resume_text = pdf_text_cache.get(pdf_key)
+    if resume_text is not None:
+        return resume_text
+    
+    cached = db.get_cached_result(pdf_key)
+    if cached is not None:
+        resume_text = cached['resume_text']
+    else:
+        resume_text = PDFParser.extract_text_from_bytes(pdf_bytes)
+        if not resume_text:
+            return resume_text
+        db.put_cached_result(pdf_key, {'resume_text': resume_text})
+    
+    pdf_text_cache.put(pdf_key, resume_text)
+    return resume_text
+
+
+def cacheable_response(etag, max_age, build_payload):
+    """
+    Build a privately cacheable JSON response with a weak ETag.
+    Answers 304 without serializing the payload when the client's
+    If-None-Match already matches.
+    
+    Args:
+        etag: Entity tag identifying this version of the resource
+        max_age: Seconds the client may reuse the response without revalidating
+        build_payload: Callable returning the JSON payload
+        
+    Returns:
+        Flask response
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = make_response('', 304)
+    else:
+        response = jsonify(build_payload())
+    response.set_etag(etag, weak=True)
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    return response
+
+
+def version_tag(row_id, timestamp):
+    """ETag value for a row identified by its id and last-modified timestamp"""
+    return f"{row_id}-{int(timestamp.timestamp())}" if timestamp else str(row_id)
+
+
+def run_analysis(resume_text, jd_text, cache_key):
+    """
+    Run the NLP/ML pipeline, store the result, and cache the payload.
+    
+    Args:
+        resume_text: Resume text to analyze
+        jd_text: Job description text (may be empty)
+        cache_key: Results cache key for this resume/JD pair
+        
+    Returns:
+        Dictionary with analysis results
+    """
+    # Run the independent analyzers concurrently
+    match_future = analyzer_pool.submit(JDMatcher.compute_match_score, resume_text, jd_text) if jd_text else None
+    ats_future = analyzer_pool.submit(ATSChecker.check_compliance, resume_text)
+    verbs_future = analyzer_pool.submit(PowerVerbSuggester.analyze, resume_text)
+    quality_future = analyzer_pool.submit(resume_scorer.score_resume, resume_text, jd_text)
+    insights_future = analyzer_pool.submit(ResumeInsights.extract_insights, resume_text)
+    
+    # Perform analysis
+    results = {}
+    
+    # JD Matching
+    if match_future:
+        match_result = match_future.result()
+        results['match_score'] = match_result['match_score']
+        results['match_details'] = {
+            'common_keywords': match_result['common_keywords'],
+            'missing_keywords': match_result['missing_keywords'],
+            'important_keywords_matched': match_result['important_keywords_matched'],
+            'important_keywords_total': match_result['important_keywords_total'],
+            'matched_important_keywords': match_result['matched_important_keywords']
+        }
+    else:
+        results['match_score'] = None
+        results['match_details'] = None
+    
+    # ATS Check
+    ats_result = ats_future.result()
+    results['ats_score'] = ats_result['ats_score']
+    results['ats_report'] = {
+        'issues': ats_result['issues'],
+        'recommendations': ats_result['recommendations'],
+        'section_checks': ats_result['section_checks'],
+        'contact_check': ats_result['contact_check'],
+        'formatting_checks': ats_result['formatting_checks']
+    }
+    
+    # Power Verb Suggestions
+    verb_findings, verb_stats = verbs_future.result()
+    results['power_verbs'] = {
+        'findings': verb_findings[:10],  # Top 10
+        'stats': verb_stats
+    }
+    
+    # ML Quality Score
+    quality_result = quality_future.result()
+    results['quality_score'] = quality_result['quality_score']
+    results['quality_details'] = {
+        'model_used': quality_result['model_used'],
+        'features': quality_result['features']
+    }
+
+    # Resume insights (projects & achievements)
+    results['resume_insights'] = insights_future.result()
+    
+    # Store in database
+    try:
+        resume_id, job_id, analysis_id = db.insert_full_analysis(
+            resume_text=resume_text,
+            jd_text=jd_text,
+            match_score=results.get('match_score'),
+            ats_score=results['ats_score'],
+            quality_score=results['quality_score'],
+            ats_flags=results['ats_report'],
+            power_verb_suggestions=results['power_verbs'],
+            match_details=results.get('match_details')
+        )
+        
+        results['analysis_id'] = analysis_id
+        results['resume_id'] = resume_id
+        results['job_id'] = job_id
+    except Exception as e:
+        print(f"Error storing analysis in database: {e}")
+        # Continue even if database storage fails, but don't cache the payload:
+        # a resubmission should retry the insert so it reaches the history
+        results['analysis_id'] = None
+        return results
+    
+    # Cache the assembled payload for identical future submissions
+    results_cache.put(cache_key, results)
+    db.put_cached_result(cache_key, results)
+    
+    return results
+
+
 @api_bp.route('/analyze', methods=['POST'])
 def analyze_resume():
     """
@@ -38,20 +225,53 @@ def analyze_resume():
     - resume_text: Plain text resume (optional if resume_file provided)
     - job_description: Job description text
     
+    Text-only submissions may instead send a JSON object with the
+    resume_text and job_description fields.
+    
+    Query parameters:
+    - async: When true, queue the analysis and return a task ID (202)
+    
     Returns:
-        JSON with analysis results
+        JSON with analysis results, or {task_id} when run asynchronously
     """
     try:
+        # JSON bodies carry text fields only; multipart bodies are parsed from the
+        # raw stream; other bodies use the form parser
+        if request.is_json:
+            data = request.get_json(silent=True)
+            if not isinstance(data, dict):
+                return jsonify({
+                    'error': 'Request body must be a JSON object.'
+                }), 400
+            form = {
+                name: data[name] for name in TEXT_FIELDS
+                if isinstance(data.get(name), str) and data[name]
+            }
+            files = {}
+        elif request.mimetype == 'multipart/form-data':
+            try:
+                form, files = parse_analyze_form(
+                    request.stream, request.headers, Config.MAX_UPLOAD_SIZE
+                )
+            except (UploadTooLargeError, RequestEntityTooLarge):
+                return jsonify({
+                    'error': 'Uploaded file is too large.'
+                }), 413
+            except InvalidUploadError:
+                return jsonify({
+                    'error': 'Uploaded file is not a valid PDF.'
+                }), 400
+        else:
+            form, files = request.form, {}
+        
         # Get resume text
         resume_text = None
         
         # Check if resume file was uploaded
-        if 'resume_file' in request.files:
-            file = request.files['resume_file']
-            if file and file.filename and allowed_file(file.filename):
-                # Read PDF bytes
-                pdf_bytes = file.read()
-                resume_text = PDFParser.extract_text_from_bytes(pdf_bytes)
+        if 'resume_file' in files:
+            filename, pdf_bytes = files['resume_file']
+            if filename and allowed_file(filename):
+                resume_text = extract_pdf_text(pdf_bytes)
                 
                 if not resume_text:
                     return jsonify({
@@ -59,8 +279,8 @@ def analyze_resume():
                     }), 400
         
         # Check if resume text was provided directly
-        if not resume_text and 'resume_text' in request.form:
-            resume_text = request.form['resume_text']
+        if not resume_text and 'resume_text' in form:
+            resume_text = form['resume_text']
         
         if not resume_text:
             return jsonify({
@@ -68,83 +288,28 @@ def analyze_resume():
             }), 400
         
         # Get job description
-        jd_text = request.form.get('job_description', '')
+        jd_text = form.get('job_description', '')
         
-        # Perform analysis
-        results = {}
+        # Serve repeat submissions from the results cache
+        cache_key = results_cache_key(resume_text, jd_text)
+        cached = results_cache.get(cache_key)
+        if cached is None:
+            cached = db.get_cached_result(cache_key)
+            if cached is not None:
+                results_cache.put(cache_key, cached)
+        if cached is not None:
+            return jsonify(cached), 200
         
-        # JD Matching
-        if jd_text:
-            match_result = JDMatcher.compute_match_score(resume_text, jd_text)
-            results['match_score'] = match_result['match_score']
-            results['match_details'] = {
-                'common_keywords': match_result['common_keywords'],
-                'missing_keywords': match_result['missing_keywords'],
-                'important_keywords_matched': match_result['important_keywords_matched'],
-                'important_keywords_total': match_result['important_keywords_total'],
-                'matched_important_keywords': match_result['matched_important_keywords']
-            }
-        else:
-            results['match_score'] = None
-            results['match_details'] = None
-        
-        # ATS Check
-        ats_result = ATSChecker.check_compliance(resume_text)
-        results['ats_score'] = ats_result['ats_score']
-        results['ats_report'] = {
-            'issues': ats_result['issues'],
-            'recommendations': ats_result['recommendations'],
-            'section_checks': ats_result['section_checks'],
-            'contact_check': ats_result['contact_check'],
-            'formatting_checks': ats_result['formatting_checks']
-        }
-        
-        # Power Verb Suggestions
-        verb_findings = PowerVerbSuggester.find_weak_verbs(resume_text)
-        verb_stats = PowerVerbSuggester.get_power_verb_stats(resume_text)
-        results['power_verbs'] = {
-            'findings': verb_findings[:10],  # Top 10
-            'stats': verb_stats
-        }
-        
-        # ML Quality Score
-        quality_result = resume_scorer.score_resume(resume_text, jd_text)
-        results['quality_score'] = quality_result['quality_score']
-        results['quality_details'] = {
-            'model_used': quality_result['model_used'],
-            'features': quality_result['features']
-        }
-
-        # Resume insights (projects & achievements)
-        results['resume_insights'] = ResumeInsights.extract_insights(resume_text)
-        
-        # Store in database
-        try:
-            resume_id = db.insert_resume(resume_text)
-            job_id = None
-            
-            if jd_text:
-                job_id = db.insert_job(jd_text)
-            
-            analysis_id = db.insert_analysis_result(
-                resume_id=resume_id,
-                job_id=job_id,
-                match_score=results.get('match_score'),
-                ats_score=results['ats_score'],
-                quality_score=results['quality_score'],
-                ats_flags=results['ats_report'],
-                power_verb_suggestions=results['power_verbs'],
-                match_details=results.get('match_details')
+        # Run asynchronously when requested; poll /tasks/<task_id> for the result.
+        # The cache key doubles as the task ID so any worker process can
+        # answer the poll from the results cache once the analysis is stored
+        if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+            task_id = analysis_tasks.submit(
+                run_analysis, resume_text, jd_text, cache_key, task_id=cache_key
             )
-            
-            results['analysis_id'] = analysis_id
-            results['resume_id'] = resume_id
-            results['job_id'] = job_id
-        except Exception as e:
-            print(f"Error storing analysis in database: {e}")
-            # Continue even if database storage fails
-            results['analysis_id'] = None
+            return jsonify({'task_id': task_id}), 202
         
+        results = run_analysis(resume_text, jd_text, cache_key)
         return jsonify(results), 200
         
     except Exception as e:
@@ -154,13 +319,58 @@ def analyze_resume():
         }), 500
 
 
+@api_bp.route('/tasks/<task_id>', methods=['GET'])
+def get_task(task_id):
+    """
+    Get the state of an asynchronous analysis.
+    
+    Args:
+        task_id: Task ID returned by /analyze?async=true
+        
+    Returns:
+        JSON with task state and, once finished, the result or error
+    """
+    status = analysis_tasks.status(task_id)
+    
+    if status is None:
+        # Task ran in another worker process (or was evicted): report it
+        # finished if its result reached the shared results cache
+        result = results_cache.get(task_id)
+        if result is None:
+            result = db.get_cached_result(task_id)
+        if result is not None:
+            status = {'state': 'SUCCESS', 'result': result}
+    
+    if status is None:
+        return jsonify({
+            'error': 'Task not found'
+        }), 404
+    
+    return jsonify({'task_id': task_id, **status}), 200
+
+
+def format_history_item(item):
+    """Format an analysis history row for the JSON response"""
+    return {
+        'id': item['id'],
+        'resume_id': item['resume_id'],
+        'job_id': item['job_id'],
+        'match_score': float(item['match_score']) if item['match_score'] else None,
+        'ats_score': float(item['ats_score']) if item['ats_score'] else None,
+        'quality_score': float(item['quality_score']) if item['quality_score'] else None,
+        'created_at': item['created_at'].isoformat() if item['created_at'] else None,
+        'resume_preview': item['resume_preview'],
+        'jd_preview': item['jd_preview']
+    }
+
+
 @api_bp.route('/history', methods=['GET'])
 def get_history():
     """
     Get analysis history.
     
     Query parameters:
-    - limit: Maximum number of results (default: 20)
+    - limit: Maximum number of results (default: 20, max: 100)
     
     Returns:
         JSON array of analysis results
@@ -170,19 +380,7 @@ def get_history():
         history = db.get_analysis_history(limit=limit)
         
         # Format results for JSON response
-        formatted_history = []
-        for item in history:
-            formatted_history.append({
-                'id': item['id'],
-                'resume_id': item['resume_id'],
-                'job_id': item['job_id'],
-                'match_score': float(item['match_score']) if item['match_score'] else None,
-                'ats_score': float(item['ats_score']) if item['ats_score'] else None,
-                'quality_score': float(item['quality_score']) if item['quality_score'] else None,
-                'created_at': item['created_at'].isoformat() if item['created_at'] else None,
-                'resume_preview': item['resume_text'][:200] + '...' if item['resume_text'] and len(item['resume_text']) > 200 else item['resume_text'],
-                'jd_preview': item['job_description'][:200] + '...' if item['job_description'] and len(item['job_description']) > 200 else item['job_description']
-            })
+        formatted_history = [format_history_item(item) for item in history]
         
         return jsonify(formatted_history), 200
         
@@ -193,6 +391,21 @@ def get_history():
         }), 500
 
 
+@api_bp.route('/history/export', methods=['GET'])
+def export_history():
+    """
+    Stream the full analysis history as newline-delimited JSON.
+    
+    Returns:
+        application/x-ndjson stream, one analysis summary per line
+    """
+    def generate():
+        for item in db.iter_analysis_history():
+            yield json.dumps(format_history_item(item)) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
 @api_bp.route('/resume/<int:resume_id>', methods=['GET'])
 def get_resume(resume_id):
     """
@@ -212,12 +425,16 @@ def get_resume(resume_id):
                 'error': 'Resume not found'
             }), 404
         
-        return jsonify({
-            'id': resume['id'],
-            'resume_text': resume['resume_text'],
-            'created_at': resume['created_at'].isoformat() if resume['created_at'] else None,
-            'updated_at': resume['updated_at'].isoformat() if resume['updated_at'] else None
-        }), 200
+        return cacheable_response(
+            version_tag(resume['id'], resume['updated_at']),
+            Config.RESUME_CACHE_MAX_AGE,
+            lambda: {
+                'id': resume['id'],
+                'resume_text': resume['resume_text'],
+                'created_at': resume['created_at'].isoformat() if resume['created_at'] else None,
+                'updated_at': resume['updated_at'].isoformat() if resume['updated_at'] else None
+            }
+        )
         
     except Exception as e:
         print(f"Error in get_resume: {e}")
@@ -245,20 +462,25 @@ def get_analysis(analysis_id):
                 'error': 'Analysis result not found'
             }), 404
         
-        return jsonify({
-            'id': result['id'],
-            'resume_id': result['resume_id'],
-            'job_id': result['job_id'],
-            'match_score': float(result['match_score']) if result['match_score'] else None,
-            'ats_score': float(result['ats_score']) if result['ats_score'] else None,
-            'quality_score': float(result['quality_score']) if result['quality_score'] else None,
-            'ats_flags': result['ats_flags'],
-            'power_verb_suggestions': result['power_verb_suggestions'],
-            'match_details': result['match_details'],
-            'created_at': result['created_at'].isoformat() if result['created_at'] else None,
-            'resume_text': result['resume_text'],
-            'job_description': result['job_description']
-        }), 200
+        # Analysis rows never change after insert
+        return cacheable_response(
+            version_tag(result['id'], result['created_at']),
+            Config.ANALYSIS_CACHE_MAX_AGE,
+            lambda: {
+                'id': result['id'],
+                'resume_id': result['resume_id'],
+                'job_id': result['job_id'],
+                'match_score': float(result['match_score']) if result['match_score'] else None,
+                'ats_score': float(result['ats_score']) if result['ats_score'] else None,
+                'quality_score': float(result['quality_score']) if result['quality_score'] else None,
+                'ats_flags': result['ats_flags'],
+                'power_verb_suggestions': result['power_verb_suggestions'],
+                'match_details': result['match_details'],
+                'created_at': result['created_at'].isoformat() if result['created_at'] else None,
+                'resume_text': result['resume_text'],
+                'job_description': result['job_description']
+            }
+        )
         
     except Exception as e:
         print(f"Error in get_analysis: {e}")
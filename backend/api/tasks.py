@@ -0,0 +1,73 @@
+"""
+Background task queue for long-running analyses.
+Runs submitted jobs on a thread pool and tracks their futures by task id so
+clients can poll for the result instead of holding a request open.
+"""
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from backend.api.cache import LRUCache
+
+
+class TaskQueue:
+    """Submit callables to a worker pool and report their state by task id"""
+
+    def __init__(self, max_workers: int = 4, max_tracked: int = 1024):
+        """
+        Initialize the queue.
+
+        Args:
+            max_workers: Number of worker threads running tasks
+            max_tracked: Number of recent tasks whose state is retained
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='analysis'
+        )
+        self._futures = LRUCache(maxsize=max_tracked)
+
+    def submit(self, fn: Callable, *args, task_id: Optional[str] = None, **kwargs) -> str:
+        """
+        Queue a callable for background execution.
+
+        Args:
+            fn: Callable to run
+            *args, **kwargs: Arguments passed to fn
+            task_id: ID to track the task under (a random one by default);
+                resubmitting an ID that is still pending, running or
+                succeeded reuses the existing task
+
+        Returns:
+            Task ID for polling
+        """
+        if task_id is None:
+            task_id = uuid.uuid4().hex
+        else:
+            future = self._futures.get(task_id)
+            if future is not None and not (future.done() and future.exception() is not None):
+                return task_id
+        self._futures.put(task_id, self._executor.submit(fn, *args, **kwargs))
+        return task_id
+
+    def status(self, task_id: str) -> Optional[Dict]:
+        """
+        Get the state of a submitted task.
+
+        Args:
+            task_id: Task ID returned by submit
+
+        Returns:
+            Dictionary with 'state' (PENDING, STARTED, SUCCESS or FAILURE) and
+            'result' or 'error' once finished, or None for unknown tasks
+        """
+        future = self._futures.get(task_id)
+        if future is None:
+            return None
+
+        if not future.done():
+            return {'state': 'STARTED' if future.running() else 'PENDING'}
+
+        error = future.exception()
+        if error is not None:
+            return {'state': 'FAILURE', 'error': str(error)}
+
+        return {'state': 'SUCCESS', 'result': future.result()}
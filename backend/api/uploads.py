@@ -0,0 +1,103 @@
+"""
+Streaming multipart/form-data parsing for the analyze endpoint.
+Feeds request.stream through streaming-form-data so the uploaded PDF lands
+in a single in-memory buffer instead of Werkzeug's spooled temp file.
+"""
+import io
+from typing import Dict, Mapping, Tuple
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import BaseTarget, ValueTarget
+
+# Bytes read from the request body per parser call
+CHUNK_SIZE = 64 * 1024
+
+# Text fields accepted alongside the resume file
+TEXT_FIELDS = ('resume_text', 'job_description')
+
+# Leading bytes of every PDF document
+PDF_MAGIC = b'%PDF-'
+
+
+class UploadTooLargeError(Exception):
+    """Raised when a request body exceeds the configured upload limit"""
+
+
+class InvalidUploadError(Exception):
+    """Raised when an uploaded file does not start with the expected magic bytes"""
+
+
+class BytesIOTarget(BaseTarget):
+    """
+    Parser target that collects an uploaded file into a BytesIO buffer.
+    When magic is given, the upload is rejected as soon as its leading bytes
+    are known not to match, before the rest of the body is read.
+    """
+
+    def __init__(self, *args, magic: bytes = b'', **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buffer = io.BytesIO()
+        self.magic = magic
+
+    def on_data_received(self, chunk: bytes):
+        self.buffer.write(chunk)
+        if self.magic and self.buffer.tell() - len(chunk) < len(self.magic):
+            head = self.buffer.getvalue()[:len(self.magic)]
+            if not self.magic.startswith(head):
+                raise InvalidUploadError("Uploaded file is not a PDF")
+
+    @property
+    def value(self) -> bytes:
+        return self.buffer.getvalue()
+
+
+def parse_analyze_form(stream, headers: Mapping[str, str],
+                       max_size: int) -> Tuple[Dict[str, str], Dict[str, Tuple[str, bytes]]]:
+    """
+    Parse a multipart analyze request straight from the WSGI input stream.
+
+    Args:
+        stream: Raw request body stream
+        headers: Request headers (must include the multipart Content-Type)
+        max_size: Maximum number of body bytes to accept
+
+    Returns:
+        Tuple of (text fields, files) where files maps the field name to
+        (filename, content bytes)
+
+    Raises:
+        UploadTooLargeError: If the body exceeds max_size
+        InvalidUploadError: If the uploaded resume file is not a PDF
+    """
+    parser = StreamingFormDataParser(headers=headers)
+
+    text_targets = {name: ValueTarget() for name in TEXT_FIELDS}
+    for name, target in text_targets.items():
+        parser.register(name, target)
+
+    resume_target = BytesIOTarget(magic=PDF_MAGIC)
+    parser.register('resume_file', resume_target)
+
+    received = 0
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        received += len(chunk)
+        if received > max_size:
+            raise UploadTooLargeError(f"Upload exceeds {max_size} bytes")
+        parser.data_received(chunk)
+
+    fields = {
+        name: target.value.decode('utf-8', errors='replace')
+        for name, target in text_targets.items()
+        if target.value
+    }
+
+    files = {}
+    if resume_target.value and not resume_target.value.startswith(PDF_MAGIC):
+        raise InvalidUploadError("Uploaded file is not a PDF")
+
+    if resume_target.multipart_filename is not None:
+        files['resume_file'] = (resume_target.multipart_filename, resume_target.value)
+
+    return fields, files
@@ -17,6 +17,8 @@ class Config:
     MYSQL_USER = os.getenv('MYSQL_USER', 'root')
     MYSQL_PASSWORD = os.getenv('MYSQL_PASSWORD', '')
     MYSQL_DATABASE = os.getenv('MYSQL_DATABASE', 'resumesense')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 20))
     
     # File Upload Configuration
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'data/resumes')
@@ -25,6 +27,32 @@ class Config:
     # ML Model Configuration
     ML_MODEL_PATH = os.getenv('ML_MODEL_PATH', 'backend/ml/resume_quality_model.pkl')
     
+    # Analysis results cache (in-process entries)
+    RESULTS_CACHE_SIZE = int(os.getenv('RESULTS_CACHE_SIZE', 256))
+    
+    # Lifetime (seconds) of results and PDF text cached in the database
+    RESULTS_CACHE_TTL = int(os.getenv('RESULTS_CACHE_TTL', 7 * 24 * 3600))
+    
+    # Extracted PDF text cache (in-process entries, keyed by file hash)
+    PDF_TEXT_CACHE_SIZE = int(os.getenv('PDF_TEXT_CACHE_SIZE', 128))
+    
+    # Background analysis workers (for /analyze?async=true)
+    ANALYSIS_WORKERS = int(os.getenv('ANALYSIS_WORKERS', 4))
+    
+    # Threads running the per-request analyzers (JD match, ATS, verbs, ML, insights)
+    ANALYZER_THREADS = int(os.getenv('ANALYZER_THREADS', 8))
+    
+    # Batches at least this large are feature-extracted across CPU cores
+    # (ResumeScorer.score_resumes); smaller ones are not worth the process startup
+    BATCH_PARALLEL_THRESHOLD = int(os.getenv('BATCH_PARALLEL_THRESHOLD', 64))
+    
+    # Compiled Jinja template cache directory (unset: a per-user temp directory)
+    JINJA_CACHE_DIR = os.getenv('JINJA_CACHE_DIR') or None
+    
+    # Browser cache lifetime (seconds) for GET /api/resume/<id> and /api/analysis/<id>
+    RESUME_CACHE_MAX_AGE = int(os.getenv('RESUME_CACHE_MAX_AGE', 3600))
+    ANALYSIS_CACHE_MAX_AGE = int(os.getenv('ANALYSIS_CACHE_MAX_AGE', 86400))
+    
     # Allowed file extensions
     ALLOWED_EXTENSIONS = {'pdf'}
 
@@ -1,168 +1,195 @@
 """
-Database connection and setup for ResumeSense.
-Uses MySQL with pymysql connector.
+Database connection and operations for ResumeSense.
+Uses MySQL with pymysql connector behind a SQLAlchemy connection pool.
+The schema is managed by Alembic migrations (see migrations/); run
+`alembic upgrade head` before starting the app.
 """
-import pymysql
-from pymysql.cursors import DictCursor
+from contextlib import contextmanager
+import hashlib
+import time
+from pymysql.constants import FIELD_TYPE
+from pymysql.converters import conversions
+from pymysql.cursors import DictCursor, SSDictCursor
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL
 from backend.config import Config
 import json
 
+# Decode MySQL JSON columns in the driver so rows arrive as Python objects
+JSON_CONVERSIONS = dict(conversions)
+JSON_CONVERSIONS[FIELD_TYPE.JSON] = json.loads
+
+# Upper bound on rows returned by one history request
+HISTORY_MAX_LIMIT = 100
+
+# Rows fetched per round trip when streaming the history export
+EXPORT_BATCH_SIZE = 50
+
+# Number of characters of resume/JD text shown in history previews ('...' is
+# appended in SQL when the text is longer)
+PREVIEW_LENGTH = 200
+
+# Statements used on the request path. PyMySQL interpolates parameters
+# client-side (MySQL server-side PREPARE is not exposed), so these are kept as
+# module constants built once and shared by every call site.
+# Identical texts share one row: LAST_INSERT_ID(id) makes lastrowid report the
+# existing row's id when the content hash is already stored
+INSERT_RESUME_SQL = """
+    INSERT INTO resumes (resume_text, content_hash) VALUES (%s, %s)
+    ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id), updated_at = CURRENT_TIMESTAMP
+"""
+
+INSERT_JOB_SQL = """
+    INSERT INTO jobs (job_description, content_hash) VALUES (%s, %s)
+    ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id)
+"""
+
+INSERT_ANALYSIS_SQL = """
+    INSERT INTO analysis_results 
+    (resume_id, job_id, match_score, ats_score, quality_score,
+     ats_flags, power_verb_suggestions, match_details)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+SELECT_RESUME_SQL = "SELECT * FROM resumes WHERE id = %s"
+
+EXPORT_HISTORY_SQL = f"""
+    SELECT 
+        ar.id,
+        ar.resume_id,
+        ar.job_id,
+        ar.match_score,
+        ar.ats_score,
+        ar.quality_score,
+        ar.created_at,
+        IF(CHAR_LENGTH(r.resume_text) > {PREVIEW_LENGTH},
+           CONCAT(LEFT(r.resume_text, {PREVIEW_LENGTH}), '...'),
+           r.resume_text) AS resume_preview,
+        IF(CHAR_LENGTH(j.job_description) > {PREVIEW_LENGTH},
+           CONCAT(LEFT(j.job_description, {PREVIEW_LENGTH}), '...'),
+           j.job_description) AS jd_preview
+    FROM analysis_results ar
+    LEFT JOIN resumes r ON ar.resume_id = r.id
+    LEFT JOIN jobs j ON ar.job_id = j.id
+    ORDER BY ar.created_at DESC
+"""
+
+SELECT_HISTORY_SQL = EXPORT_HISTORY_SQL + "    LIMIT %s\n"
+
+SELECT_ANALYSIS_SQL = """
+    SELECT 
+        ar.*,
+        r.resume_text,
+        j.job_description
+    FROM analysis_results ar
+    LEFT JOIN resumes r ON ar.resume_id = r.id
+    LEFT JOIN jobs j ON ar.job_id = j.id
+    WHERE ar.id = %s
+"""
+
+# Cached payloads expire Config.RESULTS_CACHE_TTL seconds after they were
+# (re)written; expired rows are ignored on read and pruned periodically
+SELECT_CACHED_RESULT_SQL = """
+    SELECT payload FROM results_cache
+    WHERE cache_key = %s AND created_at >= NOW() - INTERVAL %s SECOND
+"""
+
+UPSERT_CACHED_RESULT_SQL = """
+    INSERT INTO results_cache (cache_key, payload)
+    VALUES (%s, %s)
+    ON DUPLICATE KEY UPDATE payload = VALUES(payload), created_at = CURRENT_TIMESTAMP
+"""
+
+PRUNE_CACHED_RESULTS_SQL = "DELETE FROM results_cache WHERE created_at < NOW() - INTERVAL %s SECOND"
+
+# Minimum seconds between prunes of expired cache rows in one process
+CACHE_PRUNE_INTERVAL = 3600
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest used to deduplicate stored resume and job texts"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def database_url() -> URL:
+    """SQLAlchemy URL for the configured MySQL database"""
+    return URL.create(
+        'mysql+pymysql',
+        username=Config.MYSQL_USER,
+        password=Config.MYSQL_PASSWORD,
+        host=Config.MYSQL_HOST,
+        port=Config.MYSQL_PORT,
+        database=Config.MYSQL_DATABASE,
+        query={'charset': 'utf8mb4'}
+    )
+
+
+def _load_json(value):
+    """Decode a JSON column the driver returned as text (MariaDB stores JSON as LONGTEXT)"""
+    if isinstance(value, (str, bytes)):
+        return json.loads(value)
+    return value
+
 
 class Database:
     """Database connection and operations"""
     
     def __init__(self):
-        """Initialize database connection"""
-        self.connection = None
+        """Initialize database connection pool"""
+        self.engine = None
+        self._last_prune = None
         self._connect()
-        self._create_tables()
     
     def _connect(self):
-        """Establish database connection"""
+        """Create the connection pool and verify connectivity"""
+        self.engine = create_engine(
+            database_url(),
+            connect_args={'cursorclass': DictCursor, 'conv': JSON_CONVERSIONS},
+            pool_size=Config.DB_POOL_SIZE,
+            max_overflow=Config.DB_MAX_OVERFLOW,
+            pool_pre_ping=True
+        )
         try:
-            self.connection = pymysql.connect(
-                host=Config.MYSQL_HOST,
-                port=Config.MYSQL_PORT,
-                user=Config.MYSQL_USER,
-                password=Config.MYSQL_PASSWORD,
-                database=Config.MYSQL_DATABASE,
-                cursorclass=DictCursor,
-                charset='utf8mb4'
-            )
+            with self.engine.connect() as connection:
+                connection.exec_driver_sql("SELECT 1")
             print("Database connection established")
-        except pymysql.Error as e:
-            print(f"Error connecting to database: {e}")
-            # Try to create database if it doesn't exist
-            try:
-                temp_conn = pymysql.connect(
-                    host=Config.MYSQL_HOST,
-                    port=Config.MYSQL_PORT,
-                    user=Config.MYSQL_USER,
-                    password=Config.MYSQL_PASSWORD,
-                    cursorclass=DictCursor
-                )
-                with temp_conn.cursor() as cursor:
-                    cursor.execute(f"CREATE DATABASE IF NOT EXISTS {Config.MYSQL_DATABASE}")
-                temp_conn.close()
-                # Retry connection
-                self.connection = pymysql.connect(
-                    host=Config.MYSQL_HOST,
-                    port=Config.MYSQL_PORT,
-                    user=Config.MYSQL_USER,
-                    password=Config.MYSQL_PASSWORD,
-                    database=Config.MYSQL_DATABASE,
-                    cursorclass=DictCursor,
-                    charset='utf8mb4'
-                )
-                print("Database created and connection established")
-            except Exception as e2:
-                print(f"Error creating database: {e2}")
-                raise
-    
-    def _create_tables(self):
-        """Create database tables if they don't exist"""
-        try:
-            with self.connection.cursor() as cursor:
-                # Create resumes table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS resumes (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        resume_text TEXT NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Create jobs table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS jobs (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        job_description TEXT NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Create analysis_results table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS analysis_results (
-                        id INT AUTO_INCREMENT PRIMARY KEY,
-                        resume_id INT NOT NULL,
-                        job_id INT,
-                        match_score DECIMAL(5,2),
-                        ats_score DECIMAL(5,2),
-                        quality_score DECIMAL(5,2),
-                        ats_flags JSON,
-                        power_verb_suggestions JSON,
-                        match_details JSON,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (resume_id) REFERENCES resumes(id) ON DELETE CASCADE,
-                        FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE SET NULL
-                    )
-                """)
-                
-                self.connection.commit()
-                print("Database tables created/verified")
         except Exception as e:
-            print(f"Error creating tables: {e}")
-            self.connection.rollback()
-    
-    def insert_resume(self, resume_text: str) -> int:
-        """
-        Insert a new resume into the database.
-        
-        Args:
-            resume_text: Resume text content
-            
-        Returns:
-            ID of inserted resume
-        """
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(
-                    "INSERT INTO resumes (resume_text) VALUES (%s)",
-                    (resume_text,)
-                )
-                self.connection.commit()
-                return cursor.lastrowid
-        except Exception as e:
-            print(f"Error inserting resume: {e}")
-            self.connection.rollback()
+            print(f"Error connecting to database: {e}")
             raise
     
-    def insert_job(self, job_description: str) -> int:
+    @contextmanager
+    def _cursor(self, cursor_class=None):
         """
-        Insert a new job description into the database.
+        Check out a pooled connection and yield a cursor.
+        Commits when the block succeeds, rolls back on error, and always
+        returns the connection to the pool.
         
         Args:
-            job_description: Job description text
-            
-        Returns:
-            ID of inserted job
+            cursor_class: Cursor class to use instead of the connection default
         """
+        connection = self.engine.raw_connection()
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(
-                    "INSERT INTO jobs (job_description) VALUES (%s)",
-                    (job_description,)
-                )
-                self.connection.commit()
-                return cursor.lastrowid
-        except Exception as e:
-            print(f"Error inserting job: {e}")
-            self.connection.rollback()
+            with connection.cursor(cursor_class) as cursor:
+                yield cursor
+            connection.commit()
+        except Exception:
+            connection.rollback()
             raise
+        finally:
+            connection.close()
     
-    def insert_analysis_result(self, resume_id: int, job_id: int = None,
-                              match_score: float = None, ats_score: float = None,
-                              quality_score: float = None, ats_flags: dict = None,
-                              power_verb_suggestions: list = None,
-                              match_details: dict = None) -> int:
+    def insert_full_analysis(self, resume_text: str, jd_text: str = None,
+                             match_score: float = None, ats_score: float = None,
+                             quality_score: float = None, ats_flags: dict = None,
+                             power_verb_suggestions: list = None,
+                             match_details: dict = None) -> tuple:
         """
-        Insert analysis result into the database.
+        Insert a resume, its job description and the analysis result in a
+        single transaction (one connection checkout and one commit).
         
         Args:
-            resume_id: ID of the resume
-            job_id: ID of the job (optional)
+            resume_text: Resume text content
+            jd_text: Job description text (optional)
             match_score: JD-Resume match score
             ats_score: ATS compliance score
             quality_score: ML quality score
@@ -171,16 +198,19 @@ class Database:
             match_details: JD match details
             
         Returns:
-            ID of inserted analysis result
+            Tuple of (resume_id, job_id, analysis_id); job_id is None without a JD
         """
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO analysis_results 
-                    (resume_id, job_id, match_score, ats_score, quality_score,
-                     ats_flags, power_verb_suggestions, match_details)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
+            with self._cursor() as cursor:
+                cursor.execute(INSERT_RESUME_SQL, (resume_text, content_hash(resume_text)))
+                resume_id = cursor.lastrowid
+                
+                job_id = None
+                if jd_text:
+                    cursor.execute(INSERT_JOB_SQL, (jd_text, content_hash(jd_text)))
+                    job_id = cursor.lastrowid
+                
+                cursor.execute(INSERT_ANALYSIS_SQL, (
                     resume_id,
                     job_id,
                     match_score,
@@ -190,11 +220,9 @@ class Database:
                     json.dumps(power_verb_suggestions) if power_verb_suggestions else None,
                     json.dumps(match_details) if match_details else None
                 ))
-                self.connection.commit()
-                return cursor.lastrowid
+                return resume_id, job_id, cursor.lastrowid
         except Exception as e:
-            print(f"Error inserting analysis result: {e}")
-            self.connection.rollback()
+            print(f"Error inserting analysis: {e}")
             raise
     
     def get_resume(self, resume_id: int) -> dict:
@@ -208,11 +236,8 @@ class Database:
             Resume dictionary or None
         """
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(
-                    "SELECT * FROM resumes WHERE id = %s",
-                    (resume_id,)
-                )
+            with self._cursor() as cursor:
+                cursor.execute(SELECT_RESUME_SQL, (resume_id,))
                 return cursor.fetchone()
         except Exception as e:
             print(f"Error getting resume: {e}")
@@ -223,49 +248,39 @@ class Database:
         Get analysis history.
         
         Args:
-            limit: Maximum number of results to return
+            limit: Maximum number of results to return (capped at HISTORY_MAX_LIMIT)
             
         Returns:
-            List of analysis results
+            List of analysis summaries with truncated resume/JD previews
         """
+        limit = min(max(int(limit), 1), HISTORY_MAX_LIMIT)
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("""
-                    SELECT 
-                        ar.id,
-                        ar.resume_id,
-                        ar.job_id,
-                        ar.match_score,
-                        ar.ats_score,
-                        ar.quality_score,
-                        ar.ats_flags,
-                        ar.power_verb_suggestions,
-                        ar.match_details,
-                        ar.created_at,
-                        r.resume_text,
-                        j.job_description
-                    FROM analysis_results ar
-                    LEFT JOIN resumes r ON ar.resume_id = r.id
-                    LEFT JOIN jobs j ON ar.job_id = j.id
-                    ORDER BY ar.created_at DESC
-                    LIMIT %s
-                """, (limit,))
+            with self._cursor() as cursor:
+                cursor.execute(SELECT_HISTORY_SQL, (limit,))
                 results = cursor.fetchall()
                 
-                # Parse JSON fields
-                for result in results:
-                    if result.get('ats_flags'):
-                        result['ats_flags'] = json.loads(result['ats_flags'])
-                    if result.get('power_verb_suggestions'):
-                        result['power_verb_suggestions'] = json.loads(result['power_verb_suggestions'])
-                    if result.get('match_details'):
-                        result['match_details'] = json.loads(result['match_details'])
-                
                 return results
         except Exception as e:
             print(f"Error getting analysis history: {e}")
             return []
     
+    def iter_analysis_history(self):
+        """
+        Stream the full analysis history, newest first.
+        Uses an unbuffered server-side cursor so rows arrive in batches
+        instead of being materialized all at once.
+        
+        Yields:
+            Analysis summaries with truncated resume/JD previews
+        """
+        with self._cursor(SSDictCursor) as cursor:
+            cursor.execute(EXPORT_HISTORY_SQL)
+            while True:
+                rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+                if not rows:
+                    break
+                yield from rows
+    
     def get_analysis_result(self, result_id: int) -> dict:
         """
         Get analysis result by ID.
@@ -277,35 +292,74 @@ class Database:
             Analysis result dictionary or None
         """
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("""
-                    SELECT 
-                        ar.*,
-                        r.resume_text,
-                        j.job_description
-                    FROM analysis_results ar
-                    LEFT JOIN resumes r ON ar.resume_id = r.id
-                    LEFT JOIN jobs j ON ar.job_id = j.id
-                    WHERE ar.id = %s
-                """, (result_id,))
+            with self._cursor() as cursor:
+                cursor.execute(SELECT_ANALYSIS_SQL, (result_id,))
                 result = cursor.fetchone()
                 
                 if result:
-                    # Parse JSON fields
-                    if result.get('ats_flags'):
-                        result['ats_flags'] = json.loads(result['ats_flags'])
-                    if result.get('power_verb_suggestions'):
-                        result['power_verb_suggestions'] = json.loads(result['power_verb_suggestions'])
-                    if result.get('match_details'):
-                        result['match_details'] = json.loads(result['match_details'])
+                    for field in ('ats_flags', 'power_verb_suggestions', 'match_details'):
+                        result[field] = _load_json(result.get(field))
                 
                 return result
         except Exception as e:
             print(f"Error getting analysis result: {e}")
             return None
     
+    def get_cached_result(self, cache_key: str) -> dict:
+        """
+        Get a cached analysis payload by content hash.
+        
+        Args:
+            cache_key: SHA-256 hex digest of the analyzed content
+            
+        Returns:
+            Cached payload dictionary, or None if missing or expired
+        """
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(SELECT_CACHED_RESULT_SQL, (cache_key, Config.RESULTS_CACHE_TTL))
+                row = cursor.fetchone()
+                return _load_json(row['payload']) if row else None
+        except Exception as e:
+            print(f"Error getting cached result: {e}")
+            return None
+    
+    def put_cached_result(self, cache_key: str, payload: dict):
+        """
+        Store an analysis payload under its content hash.
+        
+        Args:
+            cache_key: SHA-256 hex digest of the analyzed content
+            payload: Analysis results to cache
+        """
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(UPSERT_CACHED_RESULT_SQL, (cache_key, json.dumps(payload)))
+        except Exception as e:
+            print(f"Error caching result: {e}")
+            return
+        
+        now = time.monotonic()
+        if self._last_prune is None or now - self._last_prune >= CACHE_PRUNE_INTERVAL:
+            self._last_prune = now
+            self.prune_cached_results()
+    
+    def prune_cached_results(self) -> int:
+        """
+        Delete cached payloads older than Config.RESULTS_CACHE_TTL.
+        
+        Returns:
+            Number of rows deleted
+        """
+        try:
+            with self._cursor() as cursor:
+                return cursor.execute(PRUNE_CACHED_RESULTS_SQL, (Config.RESULTS_CACHE_TTL,))
+        except Exception as e:
+            print(f"Error pruning cached results: {e}")
+            return 0
+    
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
+        """Close all pooled database connections"""
+        if self.engine:
+            self.engine.dispose()
             print("Database connection closed")
@@ -3,10 +3,49 @@ Feature Extraction for Resume Quality Scoring
 Extracts features from resume text for ML model.
 """
 import re
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional
+import numpy as np
 from backend.nlp.ats_checker import ATSChecker
+from backend.nlp.jd_matcher import JDMatcher
 from backend.nlp.power_verbs import PowerVerbSuggester
 
+# One sweep counts sentence delimiters, digit runs and percentages (a digit run
+# directly followed by '%'); these never overlap, so counts match separate scans
+_TEXT_STATS_RE = re.compile(r'(?P<sent>[.!?]+)|(?P<num>\d+)(?P<pct>%)?')
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+
+_ACHIEVEMENT_KEYWORDS = ('increased', 'decreased', 'improved', 'reduced', 'achieved', 'accomplished')
+
+# Common stop words excluded from keyword density
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'should', 'could', 'may', 'might', 'must', 'can'
+})
+
+# Model feature order
+FEATURE_NAMES = (
+    'text_length', 'word_count', 'sentence_count', 'keyword_density',
+    'action_verbs_count', 'weak_verbs_count', 'power_verb_ratio',
+    'has_numbers', 'numbers_count', 'percentage_mentions',
+    'ats_score', 'has_education', 'has_experience', 'has_skills',
+    'has_contact', 'has_bullets', 'section_count',
+    'jd_match_score', 'common_keywords',
+    'has_email', 'has_phone', 'achievement_keywords'
+)
+
+_feature_values = itemgetter(*FEATURE_NAMES)
+
+# Distinct (resume, JD) pairs whose features are memoized; the same resume is
+# often scored against several JDs and training reuses the same templates
+FEATURE_CACHE_SIZE = 256
+
 
 class FeatureExtractor:
     """Extract features from resume for ML model"""
@@ -20,18 +59,78 @@ class FeatureExtractor:
             resume_text: Resume text
             jd_text: Optional job description text
             
+        Returns:
+            Dictionary of extracted features
+        """
+        # Copy so callers can modify the result without touching the cache
+        return dict(FeatureExtractor._compute_features(resume_text, jd_text or ""))
+    
+    @staticmethod
+    def extract_features_batch(resume_texts: List[str], jd_texts: Optional[List[str]] = None,
+                               processes: int = 1) -> np.ndarray:
+        """
+        Extract features for many resumes straight into one feature matrix.
+        
+        Args:
+            resume_texts: Resume texts
+            jd_texts: Optional job description per resume
+            processes: Worker processes to extract with (1 extracts in this process)
+            
+        Returns:
+            float32 array of shape (len(resume_texts), len(FEATURE_NAMES)),
+            columns in get_feature_names() order
+        """
+        if jd_texts is None:
+            jd_texts = [""] * len(resume_texts)
+        elif len(jd_texts) != len(resume_texts):
+            raise ValueError("jd_texts must have one entry per resume")
+        
+        out = np.empty((len(resume_texts), len(FEATURE_NAMES)), dtype=np.float32)
+        pairs = zip(resume_texts, jd_texts)
+        if processes > 1:
+            chunksize = max(1, len(resume_texts) // (processes * 4))
+            with ProcessPoolExecutor(processes) as executor:
+                for i, row in enumerate(executor.map(_feature_row, pairs, chunksize=chunksize)):
+                    out[i] = row
+        else:
+            for i, pair in enumerate(pairs):
+                out[i] = _feature_row(pair)
+        return out
+    
+    @staticmethod
+    @lru_cache(maxsize=FEATURE_CACHE_SIZE)
+    def _compute_features(resume_text: str, jd_text: str) -> Dict:
+        """
+        Memoized feature extraction; the returned dict is shared and must not be mutated.
+        
+        Args:
+            resume_text: Resume text
+            jd_text: Job description text ("" when absent)
+            
         Returns:
             Dictionary of extracted features
         """
         features = {}
+        text_lower = resume_text.lower()
+        words = text_lower.split()
+        
+        # Sentence delimiters, numbers and percentages in a single pass
+        sentence_breaks = numbers_count = percentage_mentions = 0
+        for match in _TEXT_STATS_RE.finditer(resume_text):
+            if match.lastgroup == 'sent':
+                sentence_breaks += 1
+            else:
+                numbers_count += 1
+                if match.group('pct'):
+                    percentage_mentions += 1
         
         # Basic text features
         features['text_length'] = len(resume_text)
-        features['word_count'] = len(resume_text.split())
-        features['sentence_count'] = len(re.split(r'[.!?]+', resume_text))
+        features['word_count'] = len(words)
+        features['sentence_count'] = sentence_breaks + 1
         
         # Keyword density
-        features['keyword_density'] = FeatureExtractor._calculate_keyword_density(resume_text)
+        features['keyword_density'] = FeatureExtractor._keyword_density(words)
         
         # Action verbs count
         verb_stats = PowerVerbSuggester.get_power_verb_stats(resume_text)
@@ -40,9 +139,9 @@ class FeatureExtractor:
         features['power_verb_ratio'] = verb_stats['power_verb_score'] / 100.0
         
         # Numbers/metrics presence
-        features['has_numbers'] = 1 if re.search(r'\d+', resume_text) else 0
-        features['numbers_count'] = len(re.findall(r'\d+', resume_text))
-        features['percentage_mentions'] = len(re.findall(r'\d+%', resume_text))
+        features['has_numbers'] = 1 if numbers_count else 0
+        features['numbers_count'] = numbers_count
+        features['percentage_mentions'] = percentage_mentions
         
         # ATS features
         ats_result = ATSChecker.check_compliance(resume_text)
@@ -59,7 +158,6 @@ class FeatureExtractor:
         
         # JD match features (if JD provided)
         if jd_text:
-            from backend.nlp.jd_matcher import JDMatcher
             match_result = JDMatcher.compute_match_score(resume_text, jd_text)
             features['jd_match_score'] = match_result['match_score'] / 100.0
             features['common_keywords'] = len(match_result['common_keywords'])
@@ -67,13 +165,13 @@ class FeatureExtractor:
             features['jd_match_score'] = 0.0
             features['common_keywords'] = 0
         
-        # Professional indicators
-        features['has_email'] = 1 if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', resume_text) else 0
-        features['has_phone'] = 1 if re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', resume_text) else 0
+        # Professional indicators; the regexes only run when the text has the
+        # '@' or digits they need
+        features['has_email'] = 1 if '@' in resume_text and _EMAIL_RE.search(resume_text) else 0
+        features['has_phone'] = 1 if numbers_count and _PHONE_RE.search(resume_text) else 0
         
         # Quantifiable achievements
-        achievement_keywords = ['increased', 'decreased', 'improved', 'reduced', 'achieved', 'accomplished']
-        features['achievement_keywords'] = sum(1 for kw in achievement_keywords if kw.lower() in resume_text.lower())
+        features['achievement_keywords'] = sum(1 for kw in _ACHIEVEMENT_KEYWORDS if kw in text_lower)
         
         return features
     
@@ -88,20 +186,24 @@ class FeatureExtractor:
         Returns:
             Keyword density ratio
         """
-        words = text.lower().split()
+        return FeatureExtractor._keyword_density(text.lower().split())
+    
+    @staticmethod
+    def _keyword_density(words: list) -> float:
+        """
+        Keyword density of already lowercased, whitespace-split words.
+        
+        Args:
+            words: Lowercased words
+            
+        Returns:
+            Keyword density ratio
+        """
         if len(words) == 0:
             return 0.0
         
-        # Common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'should', 'could', 'may', 'might', 'must', 'can'
-        }
-        
-        meaningful_words = [w for w in words if w not in stop_words and len(w) > 2]
-        return len(meaningful_words) / len(words)
+        meaningful_count = sum(1 for w in words if len(w) > 2 and w not in _STOP_WORDS)
+        return meaningful_count / len(words)
     
     @staticmethod
     def get_feature_names() -> list:
@@ -112,14 +214,19 @@ class FeatureExtractor:
         Returns:
             List of feature names
         """
-        return [
-            'text_length', 'word_count', 'sentence_count', 'keyword_density',
-            'action_verbs_count', 'weak_verbs_count', 'power_verb_ratio',
-            'has_numbers', 'numbers_count', 'percentage_mentions',
-            'ats_score', 'has_education', 'has_experience', 'has_skills',
-            'has_contact', 'has_bullets', 'section_count',
-            'jd_match_score', 'common_keywords',
-            'has_email', 'has_phone', 'achievement_keywords'
-        ]
+        return list(FEATURE_NAMES)
 
 
+def _feature_row(pair) -> tuple:
+    """
+    Feature values for one (resume_text, jd_text) pair in model order
+    (module-level so worker processes can unpickle it).
+    
+    Args:
+        pair: Tuple of (resume_text, jd_text)
+        
+    Returns:
+        Tuple of feature values
+    """
+    resume_text, jd_text = pair
+    return _feature_values(FeatureExtractor._compute_features(resume_text, jd_text or ""))
@@ -2,9 +2,12 @@
 Resume Quality Scorer using ML Model
 Loads trained model and predicts resume quality score.
 """
-import pickle
+import hashlib
+import operator
 import os
-from typing import Dict
+import threading
+from typing import Dict, List, Optional
+import joblib
 import numpy as np
 from backend.ml.feature_extractor import FeatureExtractor
 from backend.config import Config
@@ -22,15 +25,21 @@ class ResumeScorer:
         """
         self.model_path = model_path or Config.ML_MODEL_PATH
         self.model = None
+        self.model_version = 'rule_based'
+        self._predict_scores = None
         self.feature_names = FeatureExtractor.get_feature_names()
+        # Reads every feature in model order with a single C-level call
+        self._feature_vector = operator.itemgetter(*self.feature_names)
         self._load_model()
     
     def _load_model(self):
         """Load the trained model from file"""
         try:
             if os.path.exists(self.model_path):
-                with open(self.model_path, 'rb') as f:
-                    self.model = pickle.load(f)
+                # Memory-map the fitted arrays (joblib files) instead of copying
+                # them onto the heap; plain pickle files load normally
+                self.model = joblib.load(self.model_path, mmap_mode='r')
+                self.model_version = self._file_digest(self.model_path)
             else:
                 # If model doesn't exist, use a simple rule-based scorer
                 self.model = None
@@ -38,6 +47,51 @@ class ResumeScorer:
         except Exception as e:
             print(f"Error loading model: {e}. Using rule-based scoring.")
             self.model = None
+            self.model_version = 'rule_based'
+        self._predict_scores = self._resolve_predict_fn(self.model)
+    
+    @staticmethod
+    def _file_digest(path: str) -> str:
+        """
+        Short content hash identifying a model file (changes on retraining).
+        
+        Args:
+            path: Model file path
+            
+        Returns:
+            First 16 hex digits of the file's SHA-256
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+        return digest.hexdigest()[:16]
+    
+    @staticmethod
+    def _resolve_predict_fn(model):
+        """
+        Pick the model's scoring method once, so prediction does not inspect
+        the model on every call.
+        
+        Args:
+            model: Loaded model, or None
+            
+        Returns:
+            Function mapping a feature matrix to 0-100 scores, or None if the
+            model cannot predict
+        """
+        if hasattr(model, 'predict_proba'):
+            # For classification models
+            def predict_scores(feature_matrix):
+                proba = model.predict_proba(feature_matrix)
+                return (proba[:, 1] if proba.shape[1] > 1 else proba[:, 0]) * 100
+            return predict_scores
+        if hasattr(model, 'predict'):
+            # For regression models, clamped to 0-100
+            def predict_scores(feature_matrix):
+                return np.clip(model.predict(feature_matrix), 0, 100)
+            return predict_scores
+        return None
     
     def score_resume(self, resume_text: str, jd_text: str = "") -> Dict:
         """
@@ -53,24 +107,14 @@ class ResumeScorer:
         # Extract features
         features = FeatureExtractor.extract_features(resume_text, jd_text)
         
-        # Get feature values in correct order
-        feature_values = [features[name] for name in self.feature_names]
-        feature_array = np.array([feature_values])
+        # Get feature values in correct order; float32 is what the tree
+        # models compare against internally, so predict does not convert
+        feature_array = np.array([self._feature_vector(features)], dtype=np.float32)
         
         # Predict using model or fallback to rule-based
-        if self.model is not None:
+        if self._predict_scores is not None:
             try:
-                # Get probability or score from model
-                if hasattr(self.model, 'predict_proba'):
-                    # For classification models
-                    proba = self.model.predict_proba(feature_array)[0]
-                    score = proba[1] * 100 if len(proba) > 1 else proba[0] * 100
-                elif hasattr(self.model, 'predict'):
-                    # For regression models
-                    score = self.model.predict(feature_array)[0]
-                    score = max(0, min(100, score))  # Clamp to 0-100
-                else:
-                    score = self._rule_based_score(features)
+                score = self._predict_scores(feature_array)[0]
             except Exception as e:
                 print(f"Error predicting with model: {e}. Using rule-based scoring.")
                 score = self._rule_based_score(features)
@@ -83,6 +127,46 @@ class ResumeScorer:
             'model_used': 'ml_model' if self.model is not None else 'rule_based'
         }
     
+    def score_resumes(self, resume_texts: List[str], jd_texts: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Score many resumes with a single model call.
+        Features go straight into one matrix instead of per-resume dicts;
+        large batches are extracted across CPU cores.
+        
+        Args:
+            resume_texts: Resume texts
+            jd_texts: Optional job description per resume
+            
+        Returns:
+            List of dictionaries with quality_score and model_used, one per resume
+        """
+        processes = 1
+        if len(resume_texts) >= Config.BATCH_PARALLEL_THRESHOLD:
+            processes = os.cpu_count() or 1
+        feature_matrix = FeatureExtractor.extract_features_batch(resume_texts, jd_texts, processes)
+        
+        scores = None
+        if self._predict_scores is not None and len(feature_matrix):
+            try:
+                scores = self._predict_scores(feature_matrix)
+            except Exception as e:
+                print(f"Error predicting with model: {e}. Using rule-based scoring.")
+                scores = None
+        
+        if scores is None:
+            model_used = 'rule_based'
+            scores = [
+                self._rule_based_score(dict(zip(self.feature_names, row)))
+                for row in feature_matrix.tolist()
+            ]
+        else:
+            model_used = 'ml_model'
+        
+        return [
+            {'quality_score': round(float(score), 2), 'model_used': model_used}
+            for score in scores
+        ]
+    
     def _rule_based_score(self, features: Dict) -> float:
         """
         Fallback rule-based scoring if model is not available.
@@ -120,3 +204,20 @@ class ResumeScorer:
         return min(100.0, max(0.0, score))
 
 
+_scorer: Optional[ResumeScorer] = None
+_scorer_lock = threading.Lock()
+
+
+def get_scorer() -> ResumeScorer:
+    """
+    Get the process-wide ResumeScorer, loading the model on first use.
+    
+    Returns:
+        Shared ResumeScorer instance
+    """
+    global _scorer
+    if _scorer is None:
+        with _scorer_lock:
+            if _scorer is None:
+                _scorer = ResumeScorer()
+    return _scorer
@@ -3,7 +3,77 @@ ATS (Applicant Tracking System) Compliance Checker
 Flags common ATS issues in resumes.
 """
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Set
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; regex scanning is used without it
+    ahocorasick = None
+
+# Keywords signalling each resume section, matched as whole words (case-insensitive)
+SECTION_KEYWORDS = {
+    'education': ('education', 'academic', 'degree', 'university', 'college', 'school'),
+    'experience': ('experience', 'employment', 'work history', 'professional experience', 'career'),
+    'skills': ('skills', 'technical skills', 'competencies', 'proficiencies', 'tech stack'),
+    'contact': ('contact', 'contact information', 'contact details'),
+    'summary': ('summary', 'objective', 'profile', 'about', 'overview'),
+}
+
+# One alternation per section instead of one pattern per keyword
+_SECTION_PATTERNS = {
+    section: re.compile(r'\b(?:' + '|'.join(keywords) + r')\b', re.IGNORECASE)
+    for section, keywords in SECTION_KEYWORDS.items()
+}
+
+
+def _build_section_automaton():
+    """Aho-Corasick automaton over every section keyword, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for section, keywords in SECTION_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (section, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+_SECTION_AUTOMATON = _build_section_automaton()
+
+
+def _is_word_char(char: str) -> bool:
+    """Same test as the regex \\w class for a single character"""
+    return char.isalnum() or char == '_'
+
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RES = (
+    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),  # US format
+    re.compile(r'\(\d{3}\)\s?\d{3}[-.]?\d{4}'),    # (123) 456-7890
+    re.compile(r'\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),  # International
+)
+_ADDRESS_RE = re.compile(
+    r'\b\d{1,5}\s+[A-Za-z0-9]+\s+(Street|St|Avenue|Ave|Road|Rd|Lane|Ln|Drive|Dr|Boulevard|Blvd)\b',
+    re.IGNORECASE
+)
+_CITY_STATE_RE = re.compile(r'\b[A-Za-z]+\s*,\s*[A-Za-z]{2}\b')
+
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s]')
+# ASCII bytes matched by _SPECIAL_CHAR_RE (punctuation and control characters)
+_SPECIAL_ASCII = bytes(c for c in range(128) if _SPECIAL_CHAR_RE.match(chr(c)))
+# The same classification as a lookup table indexed by ASCII code point
+_SPECIAL_ASCII_TABLE = np.zeros(128, dtype=bool)
+_SPECIAL_ASCII_TABLE[list(_SPECIAL_ASCII)] = True
+_BULLET_RE = re.compile(r'[•\-\*]\s')
+_HEADING_CHARS_RE = re.compile(r'^[A-Za-z0-9 &/+-]+$')
+
+
+@lru_cache(maxsize=1024)
+def _is_special_code_point(code_point: int) -> bool:
+    """Whether a character is neither a word character nor whitespace"""
+    return _SPECIAL_CHAR_RE.match(chr(code_point)) is not None
 
 
 class ATSChecker:
@@ -27,12 +97,12 @@ class ATSChecker:
         """
         text_lower = resume_text.lower()
         
-        # Check for required sections
-        section_checks = ATSChecker._check_sections(resume_text, text_lower)
-        
         # Check for contact information
         contact_check = ATSChecker._check_contact_info(resume_text)
         
+        # Check for required sections
+        section_checks = ATSChecker._check_sections(resume_text, text_lower, contact_check)
+        
         # Check for problematic formatting (tables, images, etc.)
         formatting_checks = ATSChecker._check_formatting(resume_text)
         
@@ -51,49 +121,78 @@ class ATSChecker:
         }
     
     @staticmethod
-    def _check_sections(raw_text: str, text_lower: str) -> Dict[str, bool]:
+    def _check_sections(raw_text: str, text_lower: str, contact_check: Dict = None) -> Dict[str, bool]:
         """
         Check if required sections are present.
         
         Args:
             raw_text: Original resume text (with line structure)
             text_lower: Lowercase resume text
+            contact_check: Result of _check_contact_info for raw_text, if already computed
             
         Returns:
             Dictionary mapping section names to presence boolean
         """
         sections = {}
-        headings = ATSChecker._find_headings(raw_text)
+        matched = ATSChecker._find_section_keywords(text_lower)
+        headings = None
 
-        def _has_section(keywords):
-            keyword_patterns = [re.compile(rf'\b{kw}\b', re.IGNORECASE) for kw in keywords]
-            for heading in headings:
-                if any(pattern.search(heading) for pattern in keyword_patterns):
-                    return True
-            return any(pattern.search(text_lower) for pattern in keyword_patterns)
+        def _has_section(section):
+            nonlocal headings
+            if section in matched:
+                return True
+            # Headings are only scanned for sections not found in the body text
+            if headings is None:
+                headings = ATSChecker._find_headings(raw_text)
+            pattern = _SECTION_PATTERNS[section]
+            return any(pattern.search(heading) for heading in headings)
         
         # Check for education section
-        education_keywords = ['education', 'academic', 'degree', 'university', 'college', 'school']
-        sections['education'] = _has_section(education_keywords)
+        sections['education'] = _has_section('education')
         
         # Check for experience section
-        experience_keywords = ['experience', 'employment', 'work history', 'professional experience', 'career']
-        sections['experience'] = _has_section(experience_keywords)
+        sections['experience'] = _has_section('experience')
         
         # Check for skills section
-        skills_keywords = ['skills', 'technical skills', 'competencies', 'proficiencies', 'tech stack']
-        sections['skills'] = _has_section(skills_keywords)
+        sections['skills'] = _has_section('skills')
         
         # Check for contact section
-        contact_keywords = ['contact', 'contact information', 'contact details']
-        sections['contact'] = _has_section(contact_keywords) or ATSChecker._check_contact_info(raw_text)['complete']
+        if contact_check is None:
+            contact_check = ATSChecker._check_contact_info(raw_text)
+        sections['contact'] = _has_section('contact') or contact_check['complete']
         
         # Check for summary/objective
-        summary_keywords = ['summary', 'objective', 'profile', 'about', 'overview']
-        sections['summary'] = _has_section(summary_keywords)
+        sections['summary'] = _has_section('summary')
         
         return sections
     
+    @staticmethod
+    def _find_section_keywords(text_lower: str) -> Set[str]:
+        """
+        Find which sections have a whole-word keyword in the text, in one pass.
+        
+        Args:
+            text_lower: Lowercase resume text
+            
+        Returns:
+            Set of section names with at least one keyword match
+        """
+        if _SECTION_AUTOMATON is None:
+            return {section for section, pattern in _SECTION_PATTERNS.items() if pattern.search(text_lower)}
+        
+        found = set()
+        last = len(text_lower) - 1
+        for end, (section, length) in _SECTION_AUTOMATON.iter(text_lower):
+            if section in found:
+                continue
+            start = end - length + 1
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if end < last and _is_word_char(text_lower[end + 1]):
+                continue
+            found.add(section)
+        return found
+    
     @staticmethod
     def _check_contact_info(text: str) -> Dict[str, bool]:
         """
@@ -106,21 +205,13 @@ class ATSChecker:
             Dictionary with contact info checks
         """
         # Check for email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
-        has_email = bool(re.search(email_pattern, text))
+        has_email = bool(_EMAIL_RE.search(text))
         
         # Check for phone number
-        phone_patterns = [
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # US format
-            r'\(\d{3}\)\s?\d{3}[-.]?\d{4}',    # (123) 456-7890
-            r'\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}'  # International
-        ]
-        has_phone = any(re.search(pattern, text) for pattern in phone_patterns)
+        has_phone = any(pattern.search(text) for pattern in _PHONE_RES)
         
         # Check for address patterns (number + street)
-        address_pattern = r'\b\d{1,5}\s+[A-Za-z0-9]+\s+(Street|St|Avenue|Ave|Road|Rd|Lane|Ln|Drive|Dr|Boulevard|Blvd)\b'
-        city_state_pattern = r'\b[A-Za-z]+\s*,\s*[A-Za-z]{2}\b'
-        has_address = bool(re.search(address_pattern, text, re.IGNORECASE) or re.search(city_state_pattern, text))
+        has_address = bool(_ADDRESS_RE.search(text) or _CITY_STATE_RE.search(text))
         
         return {
             'has_email': has_email,
@@ -140,28 +231,43 @@ class ATSChecker:
         Returns:
             Dictionary with formatting checks
         """
-        # Check for table-like structures (multiple spaces or tabs in a row)
+        # Check for table-like structures (tabs, or 4+ space runs on 4+ lines, or
+        # pipes on 3+ lines). Lines are only walked, once, when the whole text
+        # contains a space run or pipe, and the walk stops at the first verdict.
         lines = text.split('\n')
-        multi_space_lines = sum(1 for line in lines if re.search(r' {4,}', line))
-        has_tabs = '\t' in text
-        has_pipes = sum(1 for line in lines if '|' in line) >= 3
-        has_tables = has_tabs or has_pipes or multi_space_lines >= 4
+        has_tables = '\t' in text
+        if not has_tables:
+            check_spaces = '    ' in text
+            check_pipes = '|' in text
+            if check_spaces or check_pipes:
+                multi_space_lines = pipe_lines = 0
+                for line in lines:
+                    if check_spaces and '    ' in line:
+                        multi_space_lines += 1
+                    if check_pipes and '|' in line:
+                        pipe_lines += 1
+                    if multi_space_lines >= 4 or pipe_lines >= 3:
+                        has_tables = True
+                        break
         
         # Check for excessive special characters (might indicate images or complex formatting)
-        special_char_ratio = len(re.findall(r'[^\w\s]', text)) / max(len(text), 1)
+        special_char_ratio = ATSChecker._count_special_chars(text) / max(len(text), 1)
         excessive_formatting = special_char_ratio > 0.3
         
-        # Check for headers/footers (repeated text)
+        # Check for headers/footers (repeated text). Each search stops at the
+        # second occurrence, and the footer is only searched when the header
+        # is not repeated.
         has_headers_footers = False
         if len(lines) > 10:
             header_signature = " ".join(line.strip() for line in lines[:3])
             footer_signature = " ".join(line.strip() for line in lines[-3:])
-            repeated_header = header_signature and text.count(header_signature) > 1
-            repeated_footer = footer_signature and text.count(footer_signature) > 1
-            has_headers_footers = repeated_header or repeated_footer
+            has_headers_footers = (
+                ATSChecker._occurs_twice(text, header_signature)
+                or ATSChecker._occurs_twice(text, footer_signature)
+            )
         
         # Check for bullet points (good for ATS)
-        has_bullets = bool(re.search(r'[•\-\*]\s', text))
+        has_bullets = bool(_BULLET_RE.search(text))
         
         return {
             'has_tables': has_tables,
@@ -170,6 +276,52 @@ class ATSChecker:
             'has_bullets': has_bullets
         }
     
+    @staticmethod
+    def _occurs_twice(text: str, signature: str) -> bool:
+        """
+        Check whether a non-empty signature occurs at least twice without overlapping
+        (equivalent to text.count(signature) > 1, without counting every occurrence).
+        
+        Args:
+            text: Resume text
+            signature: Text to look for
+            
+        Returns:
+            True if the signature is repeated
+        """
+        if not signature:
+            return False
+        first = text.find(signature)
+        return first != -1 and text.find(signature, first + len(signature)) != -1
+    
+    @staticmethod
+    def _count_special_chars(text: str) -> int:
+        """
+        Count characters that are neither word characters nor whitespace.
+        ASCII text is counted with bytes.translate. Other text is decoded to a
+        code point array: ASCII code points go through a lookup table and the
+        few distinct non-ASCII characters (bullets, dashes, accents) are
+        classified once each.
+        
+        Args:
+            text: Resume text
+            
+        Returns:
+            Number of special characters
+        """
+        if text.isascii():
+            data = text.encode('ascii')
+            return len(data) - len(data.translate(None, _SPECIAL_ASCII))
+        
+        code_points = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        is_ascii = code_points < 128
+        count = int(np.count_nonzero(_SPECIAL_ASCII_TABLE[code_points[is_ascii]]))
+        distinct, occurrences = np.unique(code_points[~is_ascii], return_counts=True)
+        for code_point, occurrence in zip(distinct.tolist(), occurrences.tolist()):
+            if _is_special_code_point(code_point):
+                count += occurrence
+        return count
+    
     @staticmethod
     def _calculate_ats_score(section_checks: Dict, contact_check: Dict, formatting_checks: Dict) -> float:
         """
@@ -313,6 +465,6 @@ class ATSChecker:
             return True
         if line.isupper() and len(line) >= 3:
             return True
-        return bool(re.match(r'^[A-Za-z0-9 &/+-]+$', line)) and line == line.title()
+        return bool(_HEADING_CHARS_RE.match(line)) and line == line.title()
 
 
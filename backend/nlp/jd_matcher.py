@@ -5,13 +5,70 @@ Computes match score between resume and job description using keyword analysis.
 import re
 from typing import Dict, List, Set
 from collections import Counter
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; substring tests are used without it
+    ahocorasick = None
+
+# Common stop words excluded from general keywords, including generic job
+# posting vocabulary
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that',
+    'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each',
+    'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such',
+    'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'now',
+    'work', 'job', 'position', 'role', 'team', 'company', 'years', 'experience',
+    'responsible', 'responsibilities', 'requirement', 'requirements',
+    'preferred', 'including', 'include', 'ensure', 'ensuring', 'across',
+    'within', 'using', 'leveraging', 'strong', 'excellent', 'communication',
+    'collaboration', 'collaborative', 'stakeholder', 'stakeholders',
+    'deliver', 'delivery', 'provide', 'ability', 'candidate', 'looking',
+    'seeking', 'fast', 'paced', 'environment', 'detail', 'detailed',
+    'driven', 'passion', 'passionate', 'motivated',
+    'self', 'starter', 'dynamic', 'highly', 'plus'
+})
+
+_TECH_EXTENSIONS = r'(js|py|java|cpp|html|css|sql|json|xml|ts|tsx|jsx)'
+
+_WORD_RE = re.compile(r'\b\w+\b')
+_ACRONYM_RE = re.compile(r'\b[A-Z]{2,5}\b')
+# Technology name and file extension (e.g., React.js, Node.js), on lowercased text
+_TECH_EXT_RE = re.compile(r'\b(\w+)\.' + _TECH_EXTENSIONS + r'\b')
+# Capitalized words and phrases (likely technologies, tools, or important terms)
+_CAP_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+# Technical patterns for important JD keywords, matched case-insensitively:
+# file extensions (the extension is captured) and acronyms (2-5 letters)
+_IMPORTANT_TECH_RES = (
+    re.compile(r'\b\w+\.' + _TECH_EXTENSIONS + r'\b', re.IGNORECASE),
+    re.compile(r'\b[A-Z]{2,5}\b', re.IGNORECASE),
+)
+
+# Generic words never reported as important JD keywords
+_IMPORTANT_SKIP_WORDS = frozenset({'the', 'this', 'we', 'you', 'your', 'our', 'company', 'team'})
+
+# Compound technical terms (e.g., "machine learning", "deep learning"), reported
+# with underscores for the spaces
+COMPOUND_TERMS = (
+    'machine learning', 'deep learning', 'neural network', 'natural language',
+    'computer vision', 'data science', 'artificial intelligence', 'reinforcement learning',
+    'supervised learning', 'unsupervised learning', 'transfer learning', 'feature engineering',
+    'ci/cd', 'devops', 'microservices', 'rest api', 'graphql', 'object oriented',
+    'functional programming', 'test driven', 'agile methodology', 'scrum master'
+)
 
 
 class JDMatcher:
     """Match resume against job description"""
     
-    # Scientific and technical domain indicators
-    SCIENTIFIC_DOMAINS = {
+    # Scientific and technical domain indicators (immutable, so structures
+    # derived from it at import time, like _TERM_AUTOMATON, stay valid)
+    SCIENTIFIC_DOMAINS = frozenset({
         # Programming Languages
         'python', 'java', 'javascript', 'typescript', 'c++', 'cpp', 'c#', 'csharp',
         'go', 'golang', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl',
@@ -33,7 +90,7 @@ class JDMatcher:
         # Academic/Research Terms
         'research', 'publication', 'thesis', 'dissertation', 'peer review', 'journal',
         'conference', 'patent', 'algorithm', 'methodology', 'hypothesis', 'experiment'
-    }
+    })
     
     @staticmethod
     def compute_match_score(resume_text: str, jd_text: str) -> Dict:
@@ -47,13 +104,32 @@ class JDMatcher:
         Returns:
             Dictionary with match score and details
         """
+        # Nothing to match against: skip tokenizing and scanning both texts
+        if not jd_text or jd_text.isspace():
+            return {
+                'match_score': 0.0,
+                'common_keywords': [],
+                'missing_keywords': [],
+                'jd_keyword_count': 0,
+                'resume_keyword_count': 0,
+                'scientific_keywords_matched': 0,
+                'scientific_keywords_total': 0,
+                'important_keywords_matched': 0,
+                'important_keywords_total': 0,
+                'matched_important_keywords': []
+            }
+        
+        # Lowercase each text once for every helper below
+        resume_lower = resume_text.lower()
+        jd_lower = jd_text.lower()
+        
         # Tokenize and clean both texts
-        resume_tokens = JDMatcher._tokenize(resume_text)
-        jd_tokens = JDMatcher._tokenize(jd_text)
+        resume_tokens = JDMatcher._tokenize(resume_text, resume_lower)
+        jd_tokens = JDMatcher._tokenize(jd_text, jd_lower)
         
         # Extract scientific/technical keywords (weighted more heavily)
-        resume_scientific = JDMatcher._extract_scientific_keywords(resume_text)
-        jd_scientific = JDMatcher._extract_scientific_keywords(jd_text)
+        resume_scientific = JDMatcher._extract_scientific_keywords(resume_text, resume_lower)
+        jd_scientific = JDMatcher._extract_scientific_keywords(jd_text, jd_lower)
         
         # Get general keyword sets (excluding common stop words)
         resume_keywords = JDMatcher._extract_keywords(resume_tokens)
@@ -87,12 +163,13 @@ class JDMatcher:
         match_score = min(100.0, max(0.0, match_score))
         
         # Extract important keywords from JD (focus on scientific/technical)
-        jd_important = JDMatcher._extract_important_keywords(jd_text)
-        matched_important = [kw for kw in jd_important if kw.lower() in resume_text.lower()]
+        jd_important = JDMatcher._extract_important_keywords(jd_text, jd_scientific)
+        matched_important = [kw for kw in jd_important if kw.lower() in resume_lower]
         
         # Combine scientific and general keywords for display
         all_common = list(common_scientific) + [kw for kw in common_keywords if kw not in common_scientific]
-        all_missing = list(jd_scientific - resume_scientific) + [kw for kw in (jd_keywords - resume_keywords) if kw not in (jd_scientific - resume_scientific)]
+        missing_scientific = jd_scientific - resume_scientific
+        all_missing = list(missing_scientific) + [kw for kw in (jd_keywords - resume_keywords) if kw not in missing_scientific]
         
         return {
             'match_score': round(match_score, 2),
@@ -108,61 +185,105 @@ class JDMatcher:
         }
     
     @staticmethod
-    def _tokenize(text: str) -> List[str]:
+    def compute_match_scores(resume_text: str, jd_texts: List[str]) -> np.ndarray:
+        """
+        Compute match scores of one resume against many job descriptions.
+        The resume is analyzed once; per-JD overlap counts are collected
+        into one array and weighted in a single vectorized step.
+        
+        Args:
+            resume_text: Extracted resume text
+            jd_texts: Job description texts
+            
+        Returns:
+            Array of unrounded match scores (0-100), one per job description,
+            equal to compute_match_score's match_score before rounding
+        """
+        resume_lower = resume_text.lower()
+        resume_scientific = JDMatcher._extract_scientific_keywords(resume_text, resume_lower)
+        resume_keywords = JDMatcher._extract_keywords(JDMatcher._tokenize(resume_text, resume_lower))
+        
+        # Columns: common scientific, JD scientific, common general, JD general
+        counts = np.zeros((len(jd_texts), 4))
+        for i, jd_text in enumerate(jd_texts):
+            if not jd_text or jd_text.isspace():
+                continue
+            jd_lower = jd_text.lower()
+            jd_scientific = JDMatcher._extract_scientific_keywords(jd_text, jd_lower)
+            jd_keywords = JDMatcher._extract_keywords(JDMatcher._tokenize(jd_text, jd_lower))
+            counts[i] = (
+                len(resume_scientific.intersection(jd_scientific)), len(jd_scientific),
+                len(resume_keywords.intersection(jd_keywords)), len(jd_keywords)
+            )
+        
+        common_scientific, total_scientific, common_keywords, total_keywords = counts.T
+        scientific_scores = np.divide(
+            common_scientific, total_scientific,
+            out=np.zeros(len(jd_texts)), where=total_scientific > 0
+        ) * 100
+        general_scores = np.divide(
+            common_keywords, total_keywords,
+            out=np.zeros(len(jd_texts)), where=total_keywords > 0
+        ) * 100
+        
+        # Weight scientific keywords 70%, general keywords 30%
+        return np.clip(scientific_scores * 0.7 + general_scores * 0.3, 0.0, 100.0)
+    
+    @staticmethod
+    def _tokenize(text: str, text_lower: str = None) -> List[str]:
         """
         Tokenize text into words.
         
         Args:
             text: Input text
+            text_lower: text.lower(), if already computed
             
         Returns:
             List of tokens
         """
         # Convert to lowercase and split
-        tokens = re.findall(r'\b\w+\b', text.lower())
+        if text_lower is None:
+            text_lower = text.lower()
+        tokens = _WORD_RE.findall(text_lower)
         return tokens
     
     @staticmethod
-    def _extract_scientific_keywords(text: str) -> Set[str]:
+    def _extract_scientific_keywords(text: str, text_lower: str = None) -> Set[str]:
         """
         Extract scientific and technical keywords from text.
         Focuses on domain-specific terminology.
         
         Args:
             text: Input text
+            text_lower: text.lower(), if already computed
             
         Returns:
             Set of scientific/technical keywords
         """
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         scientific_keywords = set()
         
-        # Check for scientific domain terms
-        for domain in JDMatcher.SCIENTIFIC_DOMAINS:
-            if domain in text_lower:
-                scientific_keywords.add(domain)
+        # Check for scientific domain terms and compound terms (substring matches)
+        if _TERM_AUTOMATON is not None:
+            for _, keywords in _TERM_AUTOMATON.iter(text_lower):
+                scientific_keywords.update(keywords)
+        else:
+            for domain in JDMatcher.SCIENTIFIC_DOMAINS:
+                if domain in text_lower:
+                    scientific_keywords.add(domain)
+            for term in COMPOUND_TERMS:
+                if term in text_lower:
+                    scientific_keywords.add(term.replace(' ', '_'))  # Use underscore for multi-word
         
         # Find technical acronyms (2-5 uppercase letters)
-        acronyms = re.findall(r'\b[A-Z]{2,5}\b', text)
+        acronyms = _ACRONYM_RE.findall(text)
         scientific_keywords.update(ac.lower() for ac in acronyms)
         
         # Find technology patterns (e.g., React.js, Node.js, etc.)
-        tech_patterns = re.findall(r'\b(\w+)\.(js|py|java|cpp|html|css|sql|json|xml|ts|tsx|jsx)\b', text_lower)
+        tech_patterns = _TECH_EXT_RE.findall(text_lower)
         scientific_keywords.update([tech[0] for tech in tech_patterns])  # Extract the technology name
         
-        # Find compound technical terms (e.g., "machine learning", "deep learning")
-        compound_terms = [
-            'machine learning', 'deep learning', 'neural network', 'natural language',
-            'computer vision', 'data science', 'artificial intelligence', 'reinforcement learning',
-            'supervised learning', 'unsupervised learning', 'transfer learning', 'feature engineering',
-            'ci/cd', 'devops', 'microservices', 'rest api', 'graphql', 'object oriented',
-            'functional programming', 'test driven', 'agile methodology', 'scrum master'
-        ]
-        
-        for term in compound_terms:
-            if term in text_lower:
-                scientific_keywords.add(term.replace(' ', '_'))  # Use underscore for multi-word
-        
         return scientific_keywords
     
     @staticmethod
@@ -177,42 +298,21 @@ class JDMatcher:
         Returns:
             Set of keywords
         """
-        # Common stop words to exclude
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that',
-            'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-            'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'each',
-            'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such',
-            'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'now',
-            'work', 'job', 'position', 'role', 'team', 'company', 'years', 'experience',
-            'responsible', 'responsibilities', 'requirement', 'requirements',
-            'preferred', 'including', 'include', 'ensure', 'ensuring', 'across',
-            'within', 'using', 'leveraging', 'strong', 'excellent', 'communication',
-            'collaboration', 'collaborative', 'stakeholder', 'stakeholders',
-            'deliver', 'delivery', 'provide', 'ability', 'candidate', 'looking',
-            'seeking', 'fast', 'paced', 'environment', 'detail', 'detailed',
-            'driven', 'passion', 'passionate', 'motivated',
-            'self', 'starter', 'dynamic', 'highly', 'plus'
-        }
-        
-        # Filter out stop words, short words, and scientific terms (already counted separately)
-        keywords = {token for token in tokens 
-                   if token not in stop_words 
-                   and len(token) > 2
-                   and token not in JDMatcher.SCIENTIFIC_DOMAINS}
+        # Filter out stop words and scientific terms (already counted separately)
+        # with one C-level set difference over the distinct tokens, then
+        # short words
+        keywords = {token for token in set(tokens).difference(_NON_KEYWORDS) if len(token) > 2}
         return keywords
     
     @staticmethod
-    def _extract_important_keywords(jd_text: str) -> List[str]:
+    def _extract_important_keywords(jd_text: str, scientific: Set[str] = None) -> List[str]:
         """
         Extract important keywords from job description.
         Prioritizes scientific and technical terms.
         
         Args:
             jd_text: Job description text
+            scientific: Scientific keywords of jd_text, if already extracted
             
         Returns:
             List of important keywords (scientific/technical prioritized)
@@ -220,35 +320,56 @@ class JDMatcher:
         important = []
         
         # First, extract scientific keywords (highest priority)
-        scientific = JDMatcher._extract_scientific_keywords(jd_text)
-        important.extend([kw.replace('_', ' ').title() if '_' in kw else kw.title() 
-                          for kw in scientific])
+        if scientific is None:
+            scientific = JDMatcher._extract_scientific_keywords(jd_text)
+        important.extend([kw.replace('_', ' ').title() for kw in scientific])
         
         # Find capitalized words (likely technologies, tools, or important terms)
-        capitalized = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', jd_text)
+        capitalized = _CAP_RE.findall(jd_text)
         
         # Find technical file extensions and patterns
-        technical_patterns = [
-            r'\b\w+\.(js|py|java|cpp|html|css|sql|json|xml|ts|tsx|jsx)\b',
-            r'\b[A-Z]{2,5}\b',  # Acronyms (2-5 letters)
-        ]
-        
         technical_terms = []
-        for pattern in technical_patterns:
-            technical_terms.extend(re.findall(pattern, jd_text, re.IGNORECASE))
+        for pattern in _IMPORTANT_TECH_RES:
+            technical_terms.extend(pattern.findall(jd_text))
         
         # Add capitalized and technical terms
         important.extend(capitalized)
         important.extend(technical_terms)
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_important = []
-        for kw in important:
-            kw_lower = kw.lower()
-            if kw_lower not in seen and kw_lower not in {'the', 'this', 'we', 'you', 'your', 'our', 'company', 'team'}:
-                seen.add(kw_lower)
-                unique_important.append(kw)
+        # Remove case-insensitive duplicates while preserving order, keeping
+        # each keyword's first spelling (the reversed zip lets earlier
+        # spellings overwrite later ones)
+        lowered = [kw.lower() for kw in important]
+        first_spelling = dict(zip(reversed(lowered), reversed(important)))
+        unique_important = [
+            first_spelling[kw_lower] for kw_lower in dict.fromkeys(lowered)
+            if kw_lower not in _IMPORTANT_SKIP_WORDS
+        ]
         
         return unique_important[:30]  # Top 30 important keywords
 
+
+def _build_term_automaton():
+    """
+    Aho-Corasick automaton over the scientific domain and compound terms, or
+    None without pyahocorasick. Each term maps to the keywords it contributes
+    (a term in both lists contributes both spellings).
+    """
+    if ahocorasick is None:
+        return None
+    keywords_by_term = {}
+    for domain in JDMatcher.SCIENTIFIC_DOMAINS:
+        keywords_by_term.setdefault(domain, set()).add(domain)
+    for term in COMPOUND_TERMS:
+        keywords_by_term.setdefault(term, set()).add(term.replace(' ', '_'))
+    automaton = ahocorasick.Automaton()
+    for term, keywords in keywords_by_term.items():
+        automaton.add_word(term, tuple(keywords))
+    automaton.make_automaton()
+    return automaton
+
+
+_TERM_AUTOMATON = _build_term_automaton()
+
+# Tokens never counted as general keywords
+_NON_KEYWORDS = _STOP_WORDS | JDMatcher.SCIENTIFIC_DOMAINS
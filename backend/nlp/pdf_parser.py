@@ -6,6 +6,24 @@ import fitz  # PyMuPDF
 import re
 from typing import Optional
 
+# Characters that are neither word characters, whitespace nor kept punctuation
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s.,;:!?\-()]')
+
+# Code points covered by the str.translate table (Latin, Greek, Cyrillic,
+# general punctuation, arrows, bullets and dingbats); rarer characters are
+# left to _SPECIAL_CHAR_RE
+_SPECIAL_CHAR_TABLE_LIMIT = 0x3000
+_BEYOND_TABLE_RE = re.compile('[\u3000-\U0010ffff]')
+
+# Fixed at import. Special characters map to a space; Latin-1 characters map
+# to themselves because a missing entry costs str.translate a LookupError;
+# anything else absent from the table passes through unchanged
+_SPECIAL_CHAR_TABLE = {
+    code_point: ' ' if _SPECIAL_CHAR_RE.match(chr(code_point)) else code_point
+    for code_point in range(_SPECIAL_CHAR_TABLE_LIMIT)
+    if code_point < 0x100 or _SPECIAL_CHAR_RE.match(chr(code_point))
+}
+
 
 class PDFParser:
     """Parse PDF resumes and extract clean text"""
@@ -22,22 +40,27 @@ class PDFParser:
             Extracted text as string, or None if extraction fails
         """
         try:
-            doc = fitz.open(pdf_path)
-            text_parts = []
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()
-                text_parts.append(text)
-            
-            doc.close()
-            full_text = "\n".join(text_parts)
-            return PDFParser._clean_text(full_text)
-            
+            with fitz.open(pdf_path) as doc:
+                return PDFParser._extract_from_doc(doc)
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return None
     
+    @staticmethod
+    def _extract_from_doc(doc) -> str:
+        """
+        Extract and clean the text of an open PDF document.
+        
+        Args:
+            doc: Open fitz document (closed by the caller's with block, even
+                when a page fails to extract)
+            
+        Returns:
+            Cleaned text of all pages
+        """
+        full_text = "\n".join([page.get_text() for page in doc])
+        return PDFParser._clean_text(full_text)
+    
     @staticmethod
     def _clean_text(text: str) -> str:
         """
@@ -49,14 +72,13 @@ class PDFParser:
         Returns:
             Cleaned text
         """
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep punctuation
-        text = re.sub(r'[^\w\s\.\,\;\:\!\?\-\(\)]', ' ', text)
-        
-        # Normalize line breaks
-        text = re.sub(r'\n+', '\n', text)
+        # Collapse each whitespace run to a single space (split() and \s agree
+        # on what whitespace is), then replace each special character, keeping
+        # punctuation, with a space. No newlines survive, so line breaks need
+        # no separate normalization.
+        text = ' '.join(text.split()).translate(_SPECIAL_CHAR_TABLE)
+        if not text.isascii() and _BEYOND_TABLE_RE.search(text):
+            text = _SPECIAL_CHAR_RE.sub(' ', text)
         
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -75,18 +97,8 @@ class PDFParser:
             Extracted text as string, or None if extraction fails
         """
         try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            text_parts = []
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()
-                text_parts.append(text)
-            
-            doc.close()
-            full_text = "\n".join(text_parts)
-            return PDFParser._clean_text(full_text)
-            
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                return PDFParser._extract_from_doc(doc)
         except Exception as e:
             print(f"Error extracting text from PDF bytes: {e}")
             return None
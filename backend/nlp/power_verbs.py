@@ -3,15 +3,27 @@ Power Verb Suggestion System
 Identifies weak verbs in resumes and suggests stronger action verbs.
 """
 import re
+from collections import Counter
+from types import MappingProxyType
 from typing import Dict, List, Tuple
 
+# Common strong action verbs counted by get_power_verb_stats
+STRONG_VERBS = (
+    'achieved', 'accomplished', 'executed', 'implemented', 'developed',
+    'created', 'designed', 'built', 'established', 'launched',
+    'managed', 'led', 'directed', 'oversaw', 'coordinated',
+    'improved', 'enhanced', 'optimized', 'increased', 'boosted',
+    'reduced', 'minimized', 'resolved', 'solved', 'delivered',
+    'produced', 'generated', 'secured', 'obtained', 'acquired'
+)
+
 
 class PowerVerbSuggester:
     """Suggest power verbs to replace weak verbs in resumes"""
     
-    # Dictionary mapping weak verbs to strong action verbs
-    VERB_REPLACEMENTS = {
-        'did': ['executed', 'implemented', 'accomplished', 'achieved'],
+    # Dictionary mapping weak verbs to strong action verbs (read-only)
+    VERB_REPLACEMENTS = MappingProxyType({
+        'did': ['performed', 'executed', 'accomplished', 'achieved'],
         'made': ['created', 'developed', 'built', 'produced', 'established'],
         'got': ['obtained', 'acquired', 'secured', 'attained'],
         'helped': ['assisted', 'supported', 'facilitated', 'enabled', 'contributed'],
@@ -39,7 +51,6 @@ class PowerVerbSuggester:
         'put': ['placed', 'positioned', 'installed', 'deployed'],
         'set': ['established', 'configured', 'arranged', 'organized'],
         'ran': ['executed', 'operated', 'administered', 'managed'],
-        'did': ['performed', 'executed', 'accomplished', 'achieved'],
         'looked': ['examined', 'reviewed', 'analyzed', 'inspected'],
         'asked': ['inquired', 'requested', 'solicited', 'consulted'],
         'told': ['informed', 'notified', 'advised', 'communicated'],
@@ -77,33 +88,13 @@ class PowerVerbSuggester:
         'happened': ['occurred', 'transpired', 'took place'],
         'mattered': ['impacted', 'influenced', 'affected', 'contributed'],
         'wanted': ['sought', 'desired', 'aimed for', 'pursued'],
-        'needed': ['required', 'demanded', 'necessitated'],
-        'tried': ['attempted', 'endeavored', 'strived', 'pursued'],
-        'used': ['utilized', 'leveraged', 'employed', 'applied'],
-        'worked': ['collaborated', 'operated', 'functioned', 'performed'],
-        'called': ['contacted', 'reached out', 'communicated', 'connected'],
-        'asked': ['inquired', 'requested', 'solicited', 'consulted'],
-        'tried': ['attempted', 'endeavored', 'pursued', 'sought'],
-        'got': ['obtained', 'acquired', 'secured', 'attained'],
-        'went': ['traveled', 'attended', 'participated'],
-        'saw': ['observed', 'monitored', 'tracked', 'analyzed'],
-        'came': ['arrived', 'joined', 'entered'],
-        'knew': ['understood', 'comprehended', 'grasped', 'mastered'],
-        'thought': ['analyzed', 'evaluated', 'considered', 'assessed'],
-        'took': ['assumed', 'undertook', 'handled', 'managed'],
-        'gave': ['provided', 'delivered', 'supplied', 'furnished'],
-        'told': ['informed', 'notified', 'advised', 'communicated'],
-        'said': ['stated', 'expressed', 'articulated', 'communicated'],
-        'went': ['traveled', 'attended', 'participated'],
-        'saw': ['observed', 'monitored', 'tracked', 'analyzed'],
-        'came': ['arrived', 'joined', 'entered'],
-        'knew': ['understood', 'comprehended', 'grasped', 'mastered'],
-        'thought': ['analyzed', 'evaluated', 'considered', 'assessed'],
-        'took': ['assumed', 'undertook', 'handled', 'managed'],
-        'gave': ['provided', 'delivered', 'supplied', 'furnished'],
-        'told': ['informed', 'notified', 'advised', 'communicated'],
-        'said': ['stated', 'expressed', 'articulated', 'communicated']
-    }
+        'needed': ['required', 'demanded', 'necessitated']
+    })
+    
+    # Top 3 suggestions per weak verb, shared by every finding
+    _TOP_SUGGESTIONS = MappingProxyType({
+        verb: tuple(suggestions[:3]) for verb, suggestions in VERB_REPLACEMENTS.items()
+    })
     
     @staticmethod
     def find_weak_verbs(resume_text: str) -> List[Dict]:
@@ -116,42 +107,7 @@ class PowerVerbSuggester:
         Returns:
             List of dictionaries with weak verb findings and suggestions
         """
-        findings = []
-        text_lower = resume_text.lower()
-        
-        # Find all verb instances
-        for weak_verb, strong_verbs in PowerVerbSuggester.VERB_REPLACEMENTS.items():
-            # Create pattern to find the verb (word boundary to avoid partial matches)
-            pattern = r'\b' + re.escape(weak_verb) + r'\b'
-            matches = list(re.finditer(pattern, text_lower))
-            
-            if matches:
-                for match in matches:
-                    # Get context around the verb (20 chars before and after)
-                    start = max(0, match.start() - 20)
-                    end = min(len(resume_text), match.end() + 20)
-                    context = resume_text[start:end]
-                    
-                    findings.append({
-                        'weak_verb': weak_verb,
-                        'suggestions': strong_verbs[:3],  # Top 3 suggestions
-                        'context': context.strip(),
-                        'position': match.start()
-                    })
-        
-        # Sort by position in text
-        findings.sort(key=lambda x: x['position'])
-        
-        # Remove duplicates (same verb in same context area)
-        unique_findings = []
-        seen_contexts = set()
-        for finding in findings:
-            context_key = (finding['weak_verb'], finding['context'][:30])
-            if context_key not in seen_contexts:
-                seen_contexts.add(context_key)
-                unique_findings.append(finding)
-        
-        return unique_findings[:20]  # Limit to top 20 findings
+        return PowerVerbSuggester._weak_verb_findings(resume_text, _scan_verbs(resume_text))
     
     @staticmethod
     def get_power_verb_stats(resume_text: str) -> Dict:
@@ -164,36 +120,95 @@ class PowerVerbSuggester:
         Returns:
             Dictionary with power verb statistics
         """
-        text_lower = resume_text.lower()
+        # Counting needs no positions: a verb matches as a whole word exactly
+        # where it is a whole \w+ token, and set lookups on the tokens are
+        # cheaper than the verb alternation
+        words = _WORD_RE.findall(resume_text.lower())
+        return PowerVerbSuggester._verb_stats(Counter(filter(_VERB_SET.__contains__, words)))
+    
+    @staticmethod
+    def analyze(resume_text: str) -> Tuple[List[Dict], Dict]:
+        """
+        Find weak verbs and compute power verb statistics from a single scan.
         
-        # Count weak verbs found
-        weak_verb_count = 0
-        weak_verbs_found = []
+        Args:
+            resume_text: Resume text to analyze
+            
+        Returns:
+            Tuple of (find_weak_verbs result, get_power_verb_stats result)
+        """
+        matches = _scan_verbs(resume_text)
+        return (
+            PowerVerbSuggester._weak_verb_findings(resume_text, matches),
+            PowerVerbSuggester._verb_stats(Counter(match.group(1) for match in matches))
+        )
+    
+    @staticmethod
+    def _weak_verb_findings(resume_text: str, matches: List[re.Match]) -> List[Dict]:
+        """
+        Build weak verb findings with suggestions from a verb scan.
         
-        for weak_verb in PowerVerbSuggester.VERB_REPLACEMENTS.keys():
-            pattern = r'\b' + re.escape(weak_verb) + r'\b'
-            matches = len(re.findall(pattern, text_lower))
-            if matches > 0:
-                weak_verb_count += matches
-                weak_verbs_found.append({
-                    'verb': weak_verb,
-                    'count': matches
-                })
+        Args:
+            resume_text: Resume text that was scanned
+            matches: Result of _scan_verbs(resume_text)
+            
+        Returns:
+            List of dictionaries with weak verb findings and suggestions
+        """
+        findings = []
+        seen_contexts = set()
         
-        # Count strong action verbs (common power verbs)
-        strong_verbs = [
-            'achieved', 'accomplished', 'executed', 'implemented', 'developed',
-            'created', 'designed', 'built', 'established', 'launched',
-            'managed', 'led', 'directed', 'oversaw', 'coordinated',
-            'improved', 'enhanced', 'optimized', 'increased', 'boosted',
-            'reduced', 'minimized', 'resolved', 'solved', 'delivered',
-            'produced', 'generated', 'secured', 'obtained', 'acquired'
+        # Matches are in text order, so findings are built only until the
+        # first 20 unique ones are found
+        for match in matches:
+            weak_verb = match.group(1)
+            suggestions = PowerVerbSuggester._TOP_SUGGESTIONS.get(weak_verb)
+            if suggestions is None:  # a strong verb
+                continue
+            
+            # Get context around the verb (20 chars before and after)
+            start = max(0, match.start() - 20)
+            end = min(len(resume_text), match.end() + 20)
+            context = resume_text[start:end].strip()
+            
+            # Skip duplicates (same verb in same context area)
+            context_key = (weak_verb, context[:30])
+            if context_key in seen_contexts:
+                continue
+            seen_contexts.add(context_key)
+            
+            findings.append({
+                'weak_verb': weak_verb,
+                'suggestions': suggestions,
+                'context': context,
+                'position': match.start()
+            })
+            if len(findings) == 20:  # Limit to top 20 findings
+                break
+        
+        return findings
+    
+    @staticmethod
+    def _verb_stats(verb_counts: Counter) -> Dict:
+        """
+        Compute power verb statistics from verb occurrence counts.
+        
+        Args:
+            verb_counts: Occurrences of each weak or strong verb in the text
+            
+        Returns:
+            Dictionary with power verb statistics
+        """
+        # Count weak verbs found, listed in VERB_REPLACEMENTS order
+        weak_verbs_found = [
+            {'verb': weak_verb, 'count': verb_counts[weak_verb]}
+            for weak_verb in PowerVerbSuggester.VERB_REPLACEMENTS
+            if weak_verb in verb_counts
         ]
+        weak_verb_count = sum(found['count'] for found in weak_verbs_found)
         
-        strong_verb_count = 0
-        for verb in strong_verbs:
-            pattern = r'\b' + re.escape(verb) + r'\b'
-            strong_verb_count += len(re.findall(pattern, text_lower))
+        # Count strong action verbs (common power verbs); a few verbs are on both lists
+        strong_verb_count = sum(count for verb, count in verb_counts.items() if verb in _STRONG_VERB_SET)
         
         return {
             'weak_verb_count': weak_verb_count,
@@ -205,3 +220,29 @@ class PowerVerbSuggester:
         }
 
 
+def _verb_pattern(verbs) -> re.Pattern:
+    """Compile one whole-word alternation capturing which verb matched"""
+    alternation = '|'.join(map(re.escape, sorted(verbs, key=lambda verb: (-len(verb), verb))))
+    return re.compile(r'\b(' + alternation + r')\b')
+
+
+# Every weak or strong verb, matched against lowercased text. Verbs are single
+# words bounded by \b, so a position matches at most one verb and one scan
+# finds the same matches as one search per verb.
+_VERB_RE = _verb_pattern(set(PowerVerbSuggester.VERB_REPLACEMENTS) | set(STRONG_VERBS))
+_STRONG_VERB_SET = frozenset(STRONG_VERBS)
+_VERB_SET = frozenset(PowerVerbSuggester.VERB_REPLACEMENTS) | _STRONG_VERB_SET
+_WORD_RE = re.compile(r'\w+')
+
+
+def _scan_verbs(resume_text: str) -> List[re.Match]:
+    """
+    Find every weak and strong verb in the text, in text order.
+    
+    Args:
+        resume_text: Resume text to scan
+        
+    Returns:
+        Matches against the lowercased text; group(1) is the verb
+    """
+    return list(_VERB_RE.finditer(resume_text.lower()))
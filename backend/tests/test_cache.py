@@ -0,0 +1,32 @@
+"""
+Unit tests for the API LRU cache
+"""
+import unittest
+from backend.api.cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test LRU cache behaviour"""
+
+    def test_get_missing_key(self):
+        """Test lookup of a key that was never stored"""
+        cache = LRUCache(maxsize=2)
+
+        self.assertIsNone(cache.get('missing'))
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first"""
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
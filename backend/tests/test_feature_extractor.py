@@ -0,0 +1,57 @@
+"""
+Unit tests for ML feature extraction
+"""
+import unittest
+from backend.ml.feature_extractor import FeatureExtractor
+
+
+class TestFeatureExtractor(unittest.TestCase):
+    """Test feature extraction"""
+
+    def setUp(self):
+        self.resume = """
+        John Doe
+        john@example.com | 555-123-4567
+
+        EXPERIENCE
+        • Led a team of 5 engineers and increased revenue by 30%
+
+        EDUCATION
+        BS Computer Science
+
+        SKILLS
+        Python, SQL
+        """
+
+    def test_extract_features_returns_all_features(self):
+        """Test that every model feature is extracted"""
+        features = FeatureExtractor.extract_features(self.resume)
+
+        self.assertEqual(set(features), set(FeatureExtractor.get_feature_names()))
+        self.assertEqual(features['percentage_mentions'], 1)
+        self.assertEqual(features['jd_match_score'], 0.0)
+
+    def test_sentence_count(self):
+        """Test that sentence_count is one more than the delimiter runs"""
+        features = FeatureExtractor.extract_features("Built it. Shipped it!! Done?")
+
+        self.assertEqual(features['sentence_count'], 4)
+
+    def test_extract_features_returns_copy(self):
+        """Test that mutating a result does not affect later calls"""
+        features = FeatureExtractor.extract_features(self.resume)
+        features['word_count'] = -1
+
+        self.assertNotEqual(FeatureExtractor.extract_features(self.resume)['word_count'], -1)
+
+    def test_extract_features_batch(self):
+        """Test that batch rows match the per-resume features in model order"""
+        matrix = FeatureExtractor.extract_features_batch([self.resume, "Short text"])
+        features = FeatureExtractor.extract_features(self.resume)
+
+        self.assertEqual(matrix.shape, (2, len(FeatureExtractor.get_feature_names())))
+        self.assertEqual(matrix[0, 1], features['word_count'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,27 @@ class TestJDMatcher(unittest.TestCase):
         
         self.assertEqual(result['match_score'], 0.0)
     
+    def test_matched_important_keywords_ignore_case(self):
+        """Test that important JD keywords match the resume case-insensitively"""
+        resume = "Built services on KUBERNETES"
+        jd = "Experience with Kubernetes and Terraform"
+        
+        result = JDMatcher.compute_match_score(resume, jd)
+        
+        self.assertIn('Kubernetes', result['matched_important_keywords'])
+        self.assertNotIn('Terraform', result['matched_important_keywords'])
+    
+    def test_compute_match_scores_batch(self):
+        """Test that batch scores equal the per-JD match scores"""
+        resume = "Python developer with Docker and AWS experience"
+        jds = ["Python Docker Kubernetes", "", "Java Spring developer"]
+        
+        scores = JDMatcher.compute_match_scores(resume, jds)
+        
+        self.assertEqual(len(scores), len(jds))
+        for score, jd in zip(scores, jds):
+            self.assertEqual(round(float(score), 2), JDMatcher.compute_match_score(resume, jd)['match_score'])
+    
     def test_tokenize(self):
         """Test tokenization"""
         text = "Python, JavaScript, and SQL!"
@@ -0,0 +1,60 @@
+"""
+Unit tests for the orjson Flask JSON provider
+"""
+import decimal
+import unittest
+import numpy as np
+from flask import Flask, jsonify
+from markupsafe import Markup
+from backend.api.json_provider import OrjsonProvider
+
+
+class TestOrjsonProvider(unittest.TestCase):
+    """Test encoding through app.json and jsonify"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.json = OrjsonProvider(self.app)
+
+    def test_sorted_keys(self):
+        """Test keys are sorted like Flask's default provider"""
+        self.assertEqual(self.app.json.dumps({'b': 1, 'a': {'d': 2, 'c': 3}}),
+                         '{"a":{"c":3,"d":2},"b":1}')
+
+    def test_decimal_as_string(self):
+        """Test Decimal values are encoded as strings"""
+        self.assertEqual(self.app.json.dumps({'score': decimal.Decimal('85.50')}),
+                         '{"score":"85.50"}')
+
+    def test_sets(self):
+        """Test sets and frozensets are encoded as arrays"""
+        self.assertEqual(self.app.json.dumps({'a': {'python'}, 'b': frozenset()}),
+                         '{"a":["python"],"b":[]}')
+
+    def test_numpy_values(self):
+        """Test NumPy scalars and arrays encode without conversion"""
+        payload = {
+            'array': np.array([1.5, 2.0], dtype=np.float64),
+            'float': np.float32(0.5),
+            'int': np.int64(3),
+        }
+
+        self.assertEqual(self.app.json.loads(self.app.json.dumps(payload)),
+                         {'array': [1.5, 2.0], 'float': 0.5, 'int': 3})
+
+    def test_html_objects(self):
+        """Test objects with __html__ are encoded as their markup"""
+        self.assertEqual(self.app.json.dumps({'tip': Markup('<b>Bold</b>')}),
+                         '{"tip":"<b>Bold</b>"}')
+
+    def test_jsonify_response(self):
+        """Test jsonify returns sorted, newline-terminated JSON"""
+        with self.app.app_context():
+            response = jsonify(z=np.int64(1), a=decimal.Decimal('2'))
+
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(response.get_data(), b'{"a":"2","z":1}\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
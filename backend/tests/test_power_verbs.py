@@ -39,6 +39,18 @@ class TestPowerVerbSuggester(unittest.TestCase):
         
         # Should return empty or minimal findings
         self.assertIsInstance(findings, list)
+    
+    def test_analyze_matches_separate_calls(self):
+        """Test that the single-scan analysis equals the two separate calls"""
+        resume = "I managed the team and led the launch. I improved uptime and did support."
+        
+        findings, stats = PowerVerbSuggester.analyze(resume)
+        
+        self.assertEqual(findings, PowerVerbSuggester.find_weak_verbs(resume))
+        self.assertEqual(stats, PowerVerbSuggester.get_power_verb_stats(resume))
+        # 'managed', 'led' and 'improved' are on both verb lists
+        self.assertEqual(stats['weak_verb_count'], 4)
+        self.assertEqual(stats['strong_verb_count'], 3)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,49 @@
+"""
+Unit tests for Resume Insights
+"""
+import unittest
+from backend.nlp.resume_insights import ResumeInsights
+
+
+class TestResumeInsights(unittest.TestCase):
+    """Test project and achievement extraction"""
+
+    def test_extract_tech_stack(self):
+        """Test tech terms are reported once, in order of first mention"""
+        text = "built with react, node.js and python; deployed on aws with c++ and elastic# tooling. react again"
+
+        stack = ResumeInsights._extract_tech_stack(text)
+
+        self.assertEqual(stack, ['React', 'NODE', 'Python', 'AWS', 'C++', 'Elastic', 'C#'])
+
+    def test_extract_tech_stack_word_boundaries(self):
+        """Test word terms do not match inside longer words"""
+        stack = ResumeInsights._extract_tech_stack("nodejs and postgresql, going nowhere")
+
+        self.assertEqual(stack, ['Nodejs', 'Postgresql'])
+
+    def test_extract_insights_returns_copy(self):
+        """Test that mutating a result does not affect later calls"""
+        resume = (
+            "PROJECTS\n"
+            "Inventory Tracker | Built a Flask and React tool that cut stock errors by 30%\n"
+        )
+        insights = ResumeInsights.extract_insights(resume)
+        self.assertEqual(len(insights['projects']), 1)
+        insights['projects'][0]['tech_stack'].append('Cobol')
+        insights['achievements'].append({})
+
+        fresh = ResumeInsights.extract_insights(resume)
+        self.assertNotIn('Cobol', fresh['projects'][0]['tech_stack'])
+        self.assertEqual(fresh['achievements'], [])
+
+    def test_keyword_families(self):
+        """Test keyword families are detected by substring"""
+        families = ResumeInsights._keyword_families("won the campus hackathon with an appliance")
+
+        self.assertEqual(families, {'project', 'achievement', 'co_curricular'})
+        self.assertEqual(ResumeInsights._keyword_families("nothing relevant here"), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for the background task queue
+"""
+import threading
+import unittest
+from backend.api.tasks import TaskQueue
+
+
+class TestTaskQueue(unittest.TestCase):
+    """Test task state reporting"""
+
+    def setUp(self):
+        self.queue = TaskQueue(max_workers=1, max_tracked=2)
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.queue._executor.shutdown(wait=True)
+
+    def _blocking_task(self, value):
+        self.started.set()
+        self.release.wait(5)
+        return value
+
+    @staticmethod
+    def _failing_task():
+        raise ValueError('bad input')
+
+    def test_unknown_task(self):
+        """Test that an id that was never submitted reports None"""
+        self.assertIsNone(self.queue.status('missing'))
+
+    def test_state_transitions(self):
+        """Test PENDING -> STARTED -> SUCCESS with a single worker"""
+        first = self.queue.submit(self._blocking_task, 'first')
+        self.assertTrue(self.started.wait(5))
+        second = self.queue.submit(self._blocking_task, 'second')
+
+        self.assertEqual(self.queue.status(first), {'state': 'STARTED'})
+        self.assertEqual(self.queue.status(second), {'state': 'PENDING'})
+
+        self.release.set()
+        self.queue._futures.get(second).result(timeout=5)
+
+        self.assertEqual(self.queue.status(first), {'state': 'SUCCESS', 'result': 'first'})
+        self.assertEqual(self.queue.status(second), {'state': 'SUCCESS', 'result': 'second'})
+
+    def test_failure(self):
+        """Test that an exception is reported as FAILURE with its message"""
+        task_id = self.queue.submit(self._failing_task)
+        self.queue._futures.get(task_id).exception(timeout=5)
+
+        self.assertEqual(self.queue.status(task_id), {'state': 'FAILURE', 'error': 'bad input'})
+
+    def test_evicts_beyond_max_tracked(self):
+        """Test that only the most recent max_tracked tasks are retained"""
+        self.release.set()
+        task_ids = [self.queue.submit(self._blocking_task, i) for i in range(3)]
+
+        self.assertIsNone(self.queue.status(task_ids[0]))
+        self.assertIsNotNone(self.queue.status(task_ids[1]))
+        self.assertIsNotNone(self.queue.status(task_ids[2]))
+
+    def test_resubmit_reuses_task(self):
+        """Test that an explicit id in flight is not queued twice"""
+        task_id = self.queue.submit(self._blocking_task, 'first', task_id='key')
+        again = self.queue.submit(self._blocking_task, 'second', task_id='key')
+        self.release.set()
+
+        self.assertEqual(again, task_id)
+        self.assertEqual(self.queue._futures.get('key').result(timeout=5), 'first')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Unit tests for streaming multipart upload parsing
+"""
+import io
+import itertools
+import unittest
+from backend.api.uploads import (
+    PDF_MAGIC,
+    BytesIOTarget,
+    InvalidUploadError,
+    UploadTooLargeError,
+    parse_analyze_form,
+)
+
+BOUNDARY = 'resumesense-test-boundary'
+HEADERS = {'Content-Type': f'multipart/form-data; boundary={BOUNDARY}'}
+PDF_BYTES = b'%PDF-1.4\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF\n'
+
+
+def multipart_body(fields=None, files=None) -> bytes:
+    """Encode text fields and (filename, content) files as a multipart body"""
+    parts = []
+    for name, value in (fields or {}).items():
+        parts.append(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode()
+            + value.encode('utf-8') + b'\r\n'
+        )
+    for name, (filename, content) in (files or {}).items():
+        parts.append(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"; '
+            f'filename="{filename}"\r\nContent-Type: application/pdf\r\n\r\n'.encode()
+            + content + b'\r\n'
+        )
+    return b''.join(parts) + f'--{BOUNDARY}--\r\n'.encode()
+
+
+def small_chunks(data: bytes):
+    """Split data into chunks cycling through 1, 2 and 3 bytes"""
+    offset = 0
+    for size in itertools.cycle((1, 2, 3)):
+        if offset >= len(data):
+            return
+        yield data[offset:offset + size]
+        offset += size
+
+
+class TrickleStream:
+    """Request stream returning at most a few bytes per read"""
+
+    def __init__(self, data: bytes):
+        self._chunks = small_chunks(data)
+        self.consumed = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = next(self._chunks, b'')
+        self.consumed += len(chunk)
+        return chunk
+
+
+class TestParseAnalyzeForm(unittest.TestCase):
+    """Test parsing of analyze requests"""
+
+    def test_text_fields_only(self):
+        """Test text fields are decoded and no file is reported"""
+        body = multipart_body(fields={
+            'resume_text': 'Jane Doe\nPython developer',
+            'job_description': 'Backend engineer',
+        })
+
+        fields, files = parse_analyze_form(io.BytesIO(body), HEADERS, 1024 * 1024)
+
+        self.assertEqual(fields, {
+            'resume_text': 'Jane Doe\nPython developer',
+            'job_description': 'Backend engineer',
+        })
+        self.assertEqual(files, {})
+
+    def test_pdf_upload(self):
+        """Test a PDF upload is returned with its filename and exact bytes"""
+        body = multipart_body(
+            fields={'job_description': 'Backend engineer'},
+            files={'resume_file': ('resume.pdf', PDF_BYTES)},
+        )
+
+        fields, files = parse_analyze_form(io.BytesIO(body), HEADERS, 1024 * 1024)
+
+        self.assertEqual(fields, {'job_description': 'Backend engineer'})
+        self.assertEqual(files, {'resume_file': ('resume.pdf', PDF_BYTES)})
+
+    def test_body_over_max_size(self):
+        """Test a body larger than max_size is rejected"""
+        body = multipart_body(files={'resume_file': ('resume.pdf', PDF_BYTES + b'0' * 4096)})
+
+        with self.assertRaises(UploadTooLargeError):
+            parse_analyze_form(io.BytesIO(body), HEADERS, 1024)
+
+    def test_empty_file_field(self):
+        """Test an empty file input yields no text fields and an empty file"""
+        body = multipart_body(files={'resume_file': ('', b'')})
+
+        fields, files = parse_analyze_form(io.BytesIO(body), HEADERS, 1024 * 1024)
+
+        self.assertEqual(fields, {})
+        self.assertEqual(files, {'resume_file': ('', b'')})
+
+
+class TestBytesIOTarget(unittest.TestCase):
+    """Test the PDF magic-byte check on uploads arriving in small chunks"""
+
+    def test_pdf_in_small_chunks(self):
+        """Test a PDF split across 1-3 byte chunks is accepted intact"""
+        target = BytesIOTarget(magic=PDF_MAGIC)
+        for chunk in small_chunks(PDF_BYTES):
+            target.data_received(chunk)
+
+        self.assertEqual(target.value, PDF_BYTES)
+
+    def test_non_pdf_rejected_early(self):
+        """Test a non-PDF is rejected within its first magic-length bytes"""
+        target = BytesIOTarget(magic=PDF_MAGIC)
+        received = 0
+
+        with self.assertRaises(InvalidUploadError):
+            for chunk in small_chunks(b'%PS-Adobe-3.0\n' + b'0' * 1024):
+                received += len(chunk)
+                target.data_received(chunk)
+
+        self.assertLessEqual(received, len(PDF_MAGIC))
+
+    def test_parse_rejects_non_pdf_before_body_is_read(self):
+        """Test the parser stops reading the request body once the upload fails the check"""
+        body = multipart_body(files={'resume_file': ('resume.pdf', b'GIF89a' + b'0' * 64 * 1024)})
+        stream = TrickleStream(body)
+
+        with self.assertRaises(InvalidUploadError):
+            parse_analyze_form(stream, HEADERS, 1024 * 1024)
+
+        # The multipart parser hands file data to the target in small batches,
+        # so a little more than the magic bytes is read, but never the body
+        self.assertLess(stream.consumed, 8 * 1024)
+
+    def test_parse_accepts_pdf_in_small_chunks(self):
+        """Test a PDF upload read 1-3 bytes at a time is returned intact"""
+        body = multipart_body(files={'resume_file': ('resume.pdf', PDF_BYTES)})
+
+        fields, files = parse_analyze_form(TrickleStream(body), HEADERS, 1024 * 1024)
+
+        self.assertEqual(files, {'resume_file': ('resume.pdf', PDF_BYTES)})
+
+
+if __name__ == '__main__':
+    unittest.main()
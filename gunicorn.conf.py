@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for ResumeSense
+Usage: gunicorn -c gunicorn.conf.py run:app
+"""
+import gc
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5001')}"
+workers = int(os.getenv('WEB_CONCURRENCY', 4))
+threads = int(os.getenv('GUNICORN_THREADS', 1))
+
+# Import the app (and with it the ML model and NLP modules) once in the master
+# so forked workers share those pages copy-on-write instead of each loading them
+preload_app = True
+
+
+def when_ready(server):
+    """Move everything loaded so far out of the GC's reach before forking"""
+    # Collections touch object headers and would copy the shared pages into
+    # every worker; frozen objects are never scanned
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """Drop pooled database connections inherited from the master"""
+    from backend.api.routes import db
+    if db.engine:
+        db.engine.dispose(close=False)
@@ -0,0 +1,48 @@
+"""
+Alembic environment for ResumeSense
+Connects with the same MySQL settings as the application (backend.config).
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from backend.db.database import database_url
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# Migrations are written as explicit DDL; there is no ORM metadata to autogenerate from
+target_metadata = None
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL to stdout without connecting (alembic upgrade --sql)"""
+    context.configure(
+        url=database_url().render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Apply migrations against the configured database"""
+    connectable = create_engine(database_url(), poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,63 @@
+"""Initial schema: resumes, jobs and analysis_results
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # IF NOT EXISTS so databases created by the application's old startup
+    # table creation can be brought under Alembic with a plain upgrade
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS resumes (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            resume_text TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        )
+    """)
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            job_description TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS analysis_results (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            resume_id INT NOT NULL,
+            job_id INT,
+            match_score DECIMAL(5,2),
+            ats_score DECIMAL(5,2),
+            quality_score DECIMAL(5,2),
+            ats_flags JSON,
+            power_verb_suggestions JSON,
+            match_details JSON,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resumes(id) ON DELETE CASCADE,
+            FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE SET NULL
+        )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TABLE IF EXISTS analysis_results")
+    op.execute("DROP TABLE IF EXISTS jobs")
+    op.execute("DROP TABLE IF EXISTS resumes")
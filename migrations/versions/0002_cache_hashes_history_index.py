@@ -0,0 +1,63 @@
+"""Results cache table, content-hash dedup columns and history index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables deduplicated by content hash
+HASHED_TABLES = ('resumes', 'jobs')
+
+
+def _existing_names(kind: str, table: str) -> set:
+    """Names of the table's existing columns or indexes (none when emitting offline SQL)"""
+    if context.is_offline_mode():
+        return set()
+    inspector = sa.inspect(op.get_bind())
+    items = inspector.get_columns(table) if kind == 'columns' else inspector.get_indexes(table)
+    return {item['name'] for item in items}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Analysis payloads (and extracted PDF text) keyed by content hash
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS results_cache (
+            cache_key CHAR(64) PRIMARY KEY,
+            payload JSON NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Skip objects an earlier startup-time schema setup may already have created
+    for table in HASHED_TABLES:
+        if 'content_hash' not in _existing_names('columns', table):
+            op.add_column(table, sa.Column('content_hash', sa.CHAR(64), nullable=True))
+
+        if f'uniq_{table}_content_hash' not in _existing_names('indexes', table):
+            op.create_index(f'uniq_{table}_content_hash', table, ['content_hash'], unique=True)
+
+    # Newest-first index for the history listing (ORDER BY created_at DESC LIMIT n)
+    if 'idx_analysis_created' not in _existing_names('indexes', 'analysis_results'):
+        op.execute("CREATE INDEX idx_analysis_created ON analysis_results (created_at DESC)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_analysis_created', table_name='analysis_results')
+    for table in HASHED_TABLES:
+        op.drop_index(f'uniq_{table}_content_hash', table_name=table)
+        op.drop_column(table, 'content_hash')
+    op.execute("DROP TABLE IF EXISTS results_cache")
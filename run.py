@@ -2,20 +2,27 @@
 Main application entry point for ResumeSense
 Flask application with API routes and frontend serving.
 """
-from flask import Flask, render_template, send_from_directory
+from flask import Flask, render_template
 from flask_cors import CORS
+from jinja2 import FileSystemBytecodeCache
 import os
 from backend.api.routes import api_bp
+from backend.api.json_provider import OrjsonProvider
 from backend.config import Config
 
 # Create Flask app
 app = Flask(__name__, 
             template_folder='frontend/templates',
             static_folder='frontend/static')
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = Config.SECRET_KEY
 app.config['UPLOAD_FOLDER'] = Config.UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = Config.MAX_UPLOAD_SIZE
 
+# Keep compiled templates on disk so fresh workers skip template compilation
+# (auto-reload stays off unless debugging, Flask's default)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(Config.JINJA_CACHE_DIR)
+
 # Enable CORS
 CORS(app)
 
@@ -38,17 +45,13 @@ def history_page():
     return render_template('history.html')
 
 
-@app.route('/static/<path:filename>')
-def static_files(filename):
-    """Serve static files"""
-    return send_from_directory(app.static_folder, filename)
-
-
 if __name__ == '__main__':
     # Run the application
     print("Starting ResumeSense application...")
     print(f"Upload folder: {Config.UPLOAD_FOLDER}")
     print(f"Database: {Config.MYSQL_DATABASE}")
     
-    # Run in development mode
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    # Development server (threaded); the debugger and reloader only run with
+    # FLASK_DEBUG=1. Production runs under gunicorn (see gunicorn.conf.py).
+    debug = os.getenv('FLASK_DEBUG', '').lower() in ('1', 'true')
+    app.run(debug=debug, host='0.0.0.0', port=5001, threaded=True)